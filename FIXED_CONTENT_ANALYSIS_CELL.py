@@ -1,58 +1,281 @@
 # 📊 FIXED Advanced BigQuery Content Analysis - COPY THIS CELL
+import sys
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from datetime import datetime, timedelta, timezone
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery, bigquery_storage
+
+# One Storage Read API client shared by every result download: rows come back as
+# Arrow record batches over gRPC instead of row-wise JSON pages
+bqstorage_client = bigquery_storage.BigQueryReadClient(credentials=credentials)
+
+# The public HN table is not partitioned, so every filter on it scans the whole
+# timestamp column. Stage the last 30 days into a copy partitioned by day; the
+# partitions expire on their own and the views below only prune into them.
+# Clustering on (type, score) lets the story/score filter skip whole storage
+# blocks of comments, polls and zero-score posts. The key and NOT NULL columns
+# are declared so the planner knows id is unique and needs no null handling.
+hn_staging_table = f"{project_id}.hackathon_ml.hn_30d"
+hn_staging_max_age = timedelta(days=1)
+
+hn_staging_refresh = f"""
+CREATE TABLE IF NOT EXISTS `{hn_staging_table}` (
+  id INT64 NOT NULL,
+  type STRING NOT NULL,
+  title STRING,
+  url STRING,
+  score INT64,
+  descendants INT64,
+  timestamp TIMESTAMP NOT NULL,
+  PRIMARY KEY (id) NOT ENFORCED
+)
+PARTITION BY DATE(timestamp)
+CLUSTER BY type, score
+OPTIONS (partition_expiration_days = 31);
+
+-- Stories from the last two days are reloaded so their still-moving scores stay current
+DELETE FROM `{hn_staging_table}`
+WHERE DATE(timestamp) >= DATE_SUB(CURRENT_DATE(), INTERVAL 2 DAY);
+
+INSERT INTO `{hn_staging_table}` (id, type, title, url, score, descendants, timestamp)
+SELECT id, type, title, url, score, descendants, timestamp
+FROM `bigquery-public-data.hacker_news.full`
+WHERE DATE(timestamp) BETWEEN DATE_SUB(CURRENT_DATE(), INTERVAL 30 DAY) AND CURRENT_DATE()
+  AND timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 30 DAY)
+  AND timestamp > (SELECT IFNULL(MAX(timestamp), TIMESTAMP '1970-01-01') FROM `{hn_staging_table}`)
+  AND id IS NOT NULL
+  AND type IS NOT NULL;
+"""
+
+def refresh_hn_staging():
+    """Load new Hacker News rows into the day-partitioned staging copy, at most once a day"""
+
+    # Table metadata is free to read; the reload scans the public table
+    try:
+        staging = client.get_table(hn_staging_table)
+    except NotFound:
+        staging = None
+
+    if staging is not None and datetime.now(timezone.utc) - staging.modified < hn_staging_max_age:
+        print(f"♻️ Staging table refreshed within the last day: {hn_staging_table}")
+        return False
+
+    print("🔄 Refreshing 30-day Hacker News staging table...")
+    client.query(hn_staging_refresh).result()
+    print(f"✅ Staging table ready: {hn_staging_table}")
+    return True
+
+# Per-day, per-category running sums over the staged stories. The refresh only
+# re-aggregates the days that can still change (the last two, plus any newer than
+# the summary), so its cost follows the new rows rather than the whole window, and
+# the analysis below only rolls up a few hundred pre-aggregated rows.
+content_summary_table = f"{project_id}.hackathon_ml.hn_cat_summary"
+content_categorize_udf = f"{project_id}.hackathon_ml.categorize_title"
+
+content_summary_refresh = f"""
+DECLARE watermark DATE;
+
+CREATE TABLE IF NOT EXISTS `{content_summary_table}` (
+  d DATE,
+  content_category STRING,
+  n INT64,
+  s INT64,
+  s2 INT64,
+  c INT64,
+  cn INT64,
+  tl INT64,
+  u INT64
+)
+PARTITION BY d
+OPTIONS (partition_expiration_days = 31);
+
+SET watermark = (
+  SELECT LEAST(IFNULL(MAX(d), DATE '1970-01-01'), DATE_SUB(CURRENT_DATE(), INTERVAL 2 DAY))
+  FROM `{content_summary_table}`
+);
+
+-- Title -> category in a single regex pass: every keyword in the title is
+-- extracted at once and the highest-priority category among them wins, so a
+-- title naming both an AI term and a big tech company is AI_TECH.
+CREATE OR REPLACE FUNCTION `{content_categorize_udf}`(t STRING)
+RETURNS STRING
+AS ((
+  SELECT 
+    CASE MIN(
+      CASE 
+        WHEN keyword IN ('ai', 'artificial intelligence', 'machine learning', 'ml', 'gpt', 'chatgpt') THEN 1
+        WHEN keyword IN ('startup', 'funding', 'investment', 'vc', 'venture') THEN 2
+        WHEN keyword IN ('security', 'privacy', 'hack', 'breach', 'cyber') THEN 3
+        WHEN keyword IN ('crypto', 'bitcoin', 'blockchain', 'ethereum') THEN 4
+        WHEN keyword IN ('google', 'apple', 'microsoft', 'amazon', 'meta', 'tesla') THEN 5
+        WHEN keyword IN ('programming', 'code', 'developer', 'software') THEN 6
+      END
+    )
+      WHEN 1 THEN 'AI_TECH'
+      WHEN 2 THEN 'STARTUP'
+      WHEN 3 THEN 'SECURITY'
+      WHEN 4 THEN 'CRYPTO'
+      WHEN 5 THEN 'BIG_TECH'
+      WHEN 6 THEN 'PROGRAMMING'
+      ELSE 'GENERAL'
+    END
+  FROM UNNEST(REGEXP_EXTRACT_ALL(
+    t,
+    r'\\b(ai|artificial intelligence|machine learning|ml|gpt|chatgpt|startup|funding|investment|vc|venture|security|privacy|hack|breach|cyber|crypto|bitcoin|blockchain|ethereum|google|apple|microsoft|amazon|meta|tesla|programming|code|developer|software)\\b'
+  )) AS keyword
+));
+
+MERGE `{content_summary_table}` T
+USING (
+  SELECT 
+    DATE(timestamp) as d,
+    `{content_categorize_udf}`(LOWER(title)) as content_category,
+    COUNT(*) as n,
+    SUM(score) as s,
+    SUM(score * score) as s2,
+    SUM(descendants) as c,
+    COUNT(descendants) as cn,
+    SUM(LENGTH(title)) as tl,
+    COUNTIF(url IS NOT NULL) as u
+  FROM `{hn_staging_table}`
+  WHERE DATE(timestamp) >= watermark
+    AND score > 0
+    AND type = 'story'
+    AND title IS NOT NULL
+  GROUP BY d, content_category
+) S
+ON T.d = S.d AND T.content_category = S.content_category
+WHEN MATCHED THEN
+  UPDATE SET n = S.n, s = S.s, s2 = S.s2, c = S.c, cn = S.cn, tl = S.tl, u = S.u
+WHEN NOT MATCHED THEN
+  INSERT ROW
+WHEN NOT MATCHED BY SOURCE AND T.d >= watermark THEN
+  DELETE;
+"""
+
+def refresh_content_summary():
+    """Merge newly staged stories into the category summary table (run after refresh_hn_staging)"""
+
+    # Only a staging reload since the last merge can change the summary
+    staging = client.get_table(hn_staging_table)
+    try:
+        summary = client.get_table(content_summary_table)
+    except NotFound:
+        summary = None
+
+    if summary is not None and summary.modified >= staging.modified:
+        print(f"♻️ Summary table already covers the staged stories: {content_summary_table}")
+        return False
+
+    print("🏗️ Refreshing content category summary table...")
+    client.query(content_summary_refresh).result()
+    print(f"✅ Summary table ready: {content_summary_table}")
+    return True
+
+# The analysis result only moves when new stories land, so it is written to a small
+# cache table and re-read from there until it is an hour old
+content_cache_table = f"{project_id}.hackathon_ml.hn_category_cache"
+content_cache_max_age = timedelta(hours=1)
+
+# Look-back window for the analysis, sent as a query parameter so the SQL text
+# stays identical from run to run
+content_window_days = 30
+
+def load_cached_content_analysis():
+    """Return the cached analysis if it is still fresh, otherwise None"""
+
+    try:
+        cache = client.get_table(content_cache_table)
+    except NotFound:
+        return None
+
+    if datetime.now(timezone.utc) - cache.modified > content_cache_max_age:
+        return None
+
+    result = client.list_rows(cache).to_arrow(bqstorage_client=bqstorage_client).to_pandas(types_mapper=pd.ArrowDtype)
+    # Table reads do not keep the query's ORDER BY
+    return result.sort_values('avg_score', ascending=False, ignore_index=True)
+
 def analyze_content_patterns():
     """Analyze content patterns using advanced BigQuery - FIXED VERSION"""
     
     print("🔍 Executing Advanced BigQuery Content Analysis...")
     
+    result = load_cached_content_analysis()
+    if result is not None:
+        print(f"♻️ Using cached analysis of {len(result)} content categories")
+        return result
+    
+    # Only a stale cache pays for bringing the staged stories and summary up to date
+    refresh_hn_staging()
+    refresh_content_summary()
+    
     content_query = f"""
+    -- One aggregation state per category; every statistic below is derived from it
+    WITH totals AS (
+      SELECT 
+        content_category,
+        SUM(n) as n,
+        SUM(s) as s,
+        SUM(s2) as s2,
+        SUM(c) as c,
+        SUM(cn) as cn,
+        SUM(tl) as tl,
+        SUM(u) as u
+      FROM `{content_summary_table}`
+      WHERE d >= DATE_SUB(CURRENT_DATE(), INTERVAL @window_days DAY)
+      GROUP BY content_category
+    ),
+    stats AS (
+      SELECT 
+        content_category,
+        
+        n as post_count,
+        s / n as avg_score,
+        -- Clamped at 0: the one-pass variance can go slightly negative from rounding
+        SQRT(GREATEST(SAFE_DIVIDE(s2 - POW(s, 2) / n, n - 1), 0)) as score_stddev,
+        c / NULLIF(cn, 0) as avg_comments,
+        tl / n as avg_title_length,
+        u / n as url_percentage,
+        
+        -- Engagement efficiency
+        ROUND((c / NULLIF(cn, 0)) / NULLIF(s / n, 0), 2) as comment_to_score_ratio
+      FROM totals
+    )
+    -- Tiers are plain projections over the per-category statistics (at most 7 rows)
     SELECT 
-      -- Content categorization
-      CASE 
-        WHEN REGEXP_CONTAINS(LOWER(title), r'\\b(ai|artificial intelligence|machine learning|ml|gpt|chatgpt)\\b') THEN 'AI_TECH'
-        WHEN REGEXP_CONTAINS(LOWER(title), r'\\b(startup|funding|investment|vc|venture)\\b') THEN 'STARTUP'
-        WHEN REGEXP_CONTAINS(LOWER(title), r'\\b(security|privacy|hack|breach|cyber)\\b') THEN 'SECURITY'
-        WHEN REGEXP_CONTAINS(LOWER(title), r'\\b(crypto|bitcoin|blockchain|ethereum)\\b') THEN 'CRYPTO'
-        WHEN REGEXP_CONTAINS(LOWER(title), r'\\b(google|apple|microsoft|amazon|meta|tesla)\\b') THEN 'BIG_TECH'
-        WHEN REGEXP_CONTAINS(LOWER(title), r'\\b(programming|code|developer|software)\\b') THEN 'PROGRAMMING'
-        ELSE 'GENERAL'
-      END as content_category,
-      
-      COUNT(*) as post_count,
-      AVG(score) as avg_score,
-      STDDEV(score) as score_stddev,
-      AVG(descendants) as avg_comments,
-      AVG(LENGTH(title)) as avg_title_length,
-      AVG(CASE WHEN url IS NOT NULL THEN 1 ELSE 0 END) as url_percentage,
-      
-      -- Engagement efficiency
-      ROUND(AVG(descendants) / NULLIF(AVG(score), 0), 2) as comment_to_score_ratio,
+      *,
       
       -- Performance classification
       CASE 
-        WHEN AVG(score) > 20 THEN 'HIGH_PERFORMANCE'
-        WHEN AVG(score) > 10 THEN 'MEDIUM_PERFORMANCE'
+        WHEN avg_score > 20 THEN 'HIGH_PERFORMANCE'
+        WHEN avg_score > 10 THEN 'MEDIUM_PERFORMANCE'
         ELSE 'LOW_PERFORMANCE'
       END as performance_tier,
       
       -- Market potential
       CASE 
-        WHEN COUNT(*) > 100 AND AVG(score) > 15 THEN 'HIGH_POTENTIAL'
-        WHEN COUNT(*) > 50 AND AVG(score) > 8 THEN 'MEDIUM_POTENTIAL'
+        WHEN post_count > 100 AND avg_score > 15 THEN 'HIGH_POTENTIAL'
+        WHEN post_count > 50 AND avg_score > 8 THEN 'MEDIUM_POTENTIAL'
         ELSE 'LOW_POTENTIAL'
       END as market_potential
       
-    FROM `bigquery-public-data.hacker_news.full`
-    WHERE timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 30 DAY)
-      AND score IS NOT NULL
-      AND score > 0
-      AND type = 'story'
-      AND title IS NOT NULL
-    GROUP BY content_category
+    FROM stats
     ORDER BY avg_score DESC
     """
     
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter('window_days', 'INT64', content_window_days)
+        ],
+        destination=content_cache_table,
+        write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE
+    )
+    
     print("⚡ Executing Advanced Content Analysis Query...")
-    result = client.query(content_query).to_dataframe()
+    result = client.query(content_query, job_config=job_config).to_arrow(bqstorage_client=bqstorage_client).to_pandas(types_mapper=pd.ArrowDtype)
     print(f"✅ Analyzed {len(result)} content categories")
     
     return result
@@ -65,10 +288,16 @@ print("=" * 60)
 
 # Display top performing categories
 print("🏆 TOP PERFORMING CONTENT CATEGORIES:")
-for idx, row in content_data.head(5).iterrows():
-    print(f"🎯 {row['content_category']}: Score {row['avg_score']:.1f} | {row['post_count']} posts | {row['market_potential']} potential")
+top_categories = content_data.head(5)[['content_category', 'avg_score', 'post_count', 'market_potential']]
+lines = [
+    f"🎯 {category}: Score {avg_score:.1f} | {post_count} posts | {potential} potential"
+    for category, avg_score, post_count, potential in top_categories.itertuples(index=False, name=None)
+]
+sys.stdout.write("\n".join(lines) + "\n")
 
-print(f"\n📈 Total Posts Analyzed: {content_data['post_count'].sum():,}")
+# post_count is Arrow-backed, so sum the Arrow column directly (no copy)
+total_posts = pc.sum(pa.array(content_data['post_count'])).as_py()
+print(f"\n📈 Total Posts Analyzed: {total_posts:,}")
 print(f"🚀 Data Source: Real BigQuery Hacker News Dataset")
 
 content_data
\ No newline at end of file
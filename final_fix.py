@@ -1,8 +1,14 @@
 import json
+import os
+
+import orjson
+
+notebook_path = 'enterprise_knowledge_ai_demo.ipynb'
+tmp_path = notebook_path + '.tmp'
 
 # Read the notebook
-with open('enterprise_knowledge_ai_demo.ipynb', 'r', encoding='utf-8') as f:
-    notebook = json.load(f)
+with open(notebook_path, 'rb') as f:
+    notebook = orjson.loads(f.read())
 
 # Find and fix ALL problematic cells
 fixed_count = 0
@@ -34,13 +40,11 @@ for i, cell in enumerate(notebook['cells']):
                 "# Path to your service account key\n",
                 "key_path = r\"C:\\Users\\msaya\\Downloads\\analog-daylight-469011-e9-b89b0752ca82.json\"\n",
                 "\n",
-                "print(\"Loading BigQuery credentials...\")\n",
-                "\n",
-                "# Create credentials object\n",
-                "credentials = service_account.Credentials.from_service_account_file(key_path)\n",
-                "\n",
-                "# Initialize BigQuery client with credentials\n",
-                "client = bigquery.Client(credentials=credentials, project=credentials.project_id)\n",
+                "# Parse the key and build the client once; re-running this cell reuses them\n",
+                "if 'credentials' not in globals() or 'client' not in globals():\n",
+                "    print(\"Loading BigQuery credentials...\")\n",
+                "    credentials = service_account.Credentials.from_service_account_file(key_path)\n",
+                "    client = bigquery.Client(credentials=credentials, project=credentials.project_id)\n",
                 "\n",
                 "project_id = credentials.project_id\n",
                 "dataset_id = 'enterprise_knowledge_ai'\n",
@@ -56,8 +60,9 @@ for i, cell in enumerate(notebook['cells']):
             fixed_count += 1
             print(f"Cell {i} fixed!")
 
-# Write the fixed notebook
-with open('enterprise_knowledge_ai_demo.ipynb', 'w', encoding='utf-8') as f:
+# Write the fixed notebook to a temp file and swap it in atomically
+with open(tmp_path, 'w', encoding='utf-8') as f:
     json.dump(notebook, f, indent=1, ensure_ascii=False)
+os.replace(tmp_path, notebook_path)
 
 print(f"Notebook fixed! {fixed_count} cells updated.")
\ No newline at end of file
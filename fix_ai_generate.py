@@ -1,35 +1,16 @@
 import json
 import re
 
+# AI.GENERATE, AI.GENERATE_DOUBLE and AI.GENERATE_BOOL share one compiled pattern,
+# so the notebook is scanned once instead of once per variant
+AI_GENERATE_MODEL = re.compile(r'AI\.GENERATE(_DOUBLE|_BOOL)?\(\s*MODEL `([^`]+)`')
+
 # Read the notebook
 with open('enterprise_knowledge_ai_demo.ipynb', 'r', encoding='utf-8') as f:
     content = f.read()
 
-# Fix AI.GENERATE syntax - remove MODEL keyword and backticks
-content = re.sub(
-    r'MODEL `bigquery-public-data\.ml_datasets\.gemini_pro`',
-    'MODEL `bigquery-public-data.ml_datasets.gemini_pro`',
-    content
-)
-
-# Actually, let's fix it properly - the AI functions need different syntax
-content = re.sub(
-    r'AI\.GENERATE\(\s*MODEL `([^`]+)`',
-    r'AI.GENERATE(\1',
-    content
-)
-
-content = re.sub(
-    r'AI\.GENERATE_DOUBLE\(\s*MODEL `([^`]+)`',
-    r'AI.GENERATE_DOUBLE(\1',
-    content
-)
-
-content = re.sub(
-    r'AI\.GENERATE_BOOL\(\s*MODEL `([^`]+)`',
-    r'AI.GENERATE_BOOL(\1',
-    content
-)
+# Fix AI.GENERATE syntax - the AI functions take the model path without the MODEL keyword and backticks
+content = AI_GENERATE_MODEL.sub(r'AI.GENERATE\1(\2', content)
 
 # Write the fixed content
 with open('enterprise_knowledge_ai_demo.ipynb', 'w', encoding='utf-8') as f:
@@ -1,8 +1,24 @@
 import json
+import os
+import sys
+
+import orjson
+
+notebook_path = 'enterprise_knowledge_ai_demo.ipynb'
+tmp_path = notebook_path + '.tmp'
 
 # Read the notebook
-with open('enterprise_knowledge_ai_demo.ipynb', 'r', encoding='utf-8') as f:
-    notebook = json.load(f)
+with open(notebook_path, 'rb') as f:
+    notebook = orjson.loads(f.read())
+
+# One substring scan over all code cells; if none of the problem markers appear
+# anywhere there is nothing to rewrite. 'AI.GENERATE' also covers the
+# generate_insights_query check below.
+code_text = ''.join(line for cell in notebook['cells'] if cell['cell_type'] == 'code' for line in cell.get('source', []))
+needles = ('bigquery-public-data.ml_datasets.gemini_pro', 'AI.GENERATE', 'ML.GENERATE_EMBEDDING(')
+if not any(needle in code_text for needle in needles):
+    print("✅ No AI.GENERATE syntax issues found, nothing to fix")
+    sys.exit(0)
 
 # Find and fix ALL problematic AI.GENERATE cells
 fixed_count = 0
@@ -38,23 +54,31 @@ for i, cell in enumerate(notebook['cells']):
                 "\"\"\"\n",
                 "\n",
                 "print(\"📊 Running demo query...\")\n",
-                "results_df = client.query(demo_query).to_dataframe()\n",
+                "results_df = client.query(demo_query).to_arrow(create_bqstorage_client=True).to_pandas(types_mapper=pd.ArrowDtype)\n",
                 "print(f\"✅ Query completed! Found {len(results_df)} documents\")\n",
                 "\n",
                 "# Display results\n",
-                "for _, row in results_df.iterrows():\n",
-                "    print(f\"\\n📄 {row['content_type'].upper()} ({row['department']})\")\n",
-                "    print(f\"   📊 Impact Score: {row['business_impact_score']:.2f}\")\n",
-                "    print(f\"   📝 AI Summary: {row['ai_summary']}\")\n",
-                "    print(f\"   📅 Created: {row['created_date']}\")"
+                "display_cols = ['content_type', 'department', 'business_impact_score', 'ai_summary', 'created_date']\n",
+                "for content_type, department, impact, summary, created in results_df[display_cols].itertuples(index=False, name=None):\n",
+                "    print(f\"\\n📄 {content_type.upper()} ({department})\")\n",
+                "    # Arrow-backed columns hold pd.NA for NULLs, which format specs reject\n",
+                "    impact_text = 'n/a' if pd.isna(impact) else f\"{impact:.2f}\"\n",
+                "    print(f\"   📊 Impact Score: {impact_text}\")\n",
+                "    print(f\"   📝 AI Summary: {summary}\")\n",
+                "    print(f\"   📅 Created: {created}\")"
             ]
             
             cell['source'] = new_source
             fixed_count += 1
             print(f"Cell {i} fixed!")
 
-# Write the fixed notebook
-with open('enterprise_knowledge_ai_demo.ipynb', 'w', encoding='utf-8') as f:
+if not fixed_count:
+    print("✅ All AI.GENERATE cells already fixed, notebook left unchanged")
+    sys.exit(0)
+
+# Write the fixed notebook to a temp file and swap it in atomically
+with open(tmp_path, 'w', encoding='utf-8') as f:
     json.dump(notebook, f, indent=1, ensure_ascii=False)
+os.replace(tmp_path, notebook_path)
 
 print(f"✅ Fixed {fixed_count} cells with AI.GENERATE syntax issues!")
\ No newline at end of file
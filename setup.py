@@ -4,6 +4,7 @@ Enterprise AI Intelligence Platform Setup Script
 Installs all required dependencies for the competition entry
 """
 
+import shutil
 import subprocess
 import sys
 import os
@@ -16,9 +17,11 @@ def install_requirements():
     
     # Required packages
     packages = [
-        'pandas>=1.3.0',
+        'pandas>=2.0.0',
         'numpy>=1.21.0', 
         'google-cloud-bigquery>=3.0.0',
+        'google-cloud-bigquery-storage>=2.0.0',
+        'pyarrow>=12.0.0',
         'plotly>=5.0.0',
         'jupyter>=1.0.0',
         'ipywidgets>=7.6.0',
@@ -27,12 +30,26 @@ def install_requirements():
     
     print("📦 Installing required packages...")
     for package in packages:
-        print(f"   Installing {package}...")
-        try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', package])
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install {package}: {e}")
-            return False
+        print(f"   {package}")
+    
+    # One install run resolves and downloads the whole set together instead of
+    # paying resolver and index startup once per package. uv downloads and
+    # unpacks wheels in parallel, so prefer it when it is on PATH.
+    uv = shutil.which('uv')
+    if uv:
+        command = [uv, 'pip', 'install', '--python', sys.executable, *packages]
+    else:
+        command = [
+            sys.executable, '-m', 'pip', 'install',
+            '--prefer-binary', '--no-input', '--disable-pip-version-check',
+            *packages
+        ]
+    
+    try:
+        subprocess.check_call(command)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install required packages: {e}")
+        return False
     
     print("\n✅ All packages installed successfully!")
     print("\n🎯 Setup Complete! Ready for competition!")
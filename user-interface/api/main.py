@@ -3,14 +3,19 @@ Enterprise Knowledge Intelligence Platform - REST API
 Provides programmatic access to insights, forecasts, and analytics
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import asyncio
 import json
+import re
 import logging
+from cachetools import TTLCache
 from google.cloud import bigquery
 import os
 
@@ -18,7 +23,9 @@ import os
 app = FastAPI(
     title="Enterprise Knowledge Intelligence API",
     description="REST API for accessing AI-powered business insights and analytics",
-    version="1.0.0"
+    version="1.0.0",
+    # Responses are encoded with orjson rather than the stdlib json encoder
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for web interface access
@@ -30,17 +37,213 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+log = logging.getLogger(__name__)
+
 # Initialize BigQuery client
 client = bigquery.Client()
 security = HTTPBearer()
 
-# Pydantic models for API requests/responses
+# Resolved once at import; every query below is built from it
+PROJECT = os.getenv('BIGQUERY_PROJECT')
+
+# Query text only depends on the project, so it is built once here and each
+# request only supplies its parameters
+INSIGHT_SQL = f"""
+WITH semantic_search AS (
+  SELECT 
+    knowledge_id,
+    content,
+    VECTOR_SEARCH(
+      TABLE `{PROJECT}.enterprise_ai.enterprise_knowledge_base`,
+      (SELECT ML.GENERATE_EMBEDDING(
+        MODEL `{PROJECT}.enterprise_ai.text_embedding_model`,
+        @query_text
+      )),
+      top_k => 5,
+      distance_type => 'COSINE'
+    ) AS similarity_score
+  FROM `{PROJECT}.enterprise_ai.enterprise_knowledge_base`
+  WHERE access_permissions IS NULL OR @user_role IN UNNEST(access_permissions)
+),
+insight_generation AS (
+  SELECT 
+    GENERATE_UUID() as insight_id,
+    AI.GENERATE(
+      MODEL `{PROJECT}.enterprise_ai.gemini_model`,
+      CONCAT(
+        'Generate actionable business insight for: ', @query_text,
+        ' Based on context: ', STRING_AGG(content, ' | ')
+      )
+    ) AS generated_insight,
+    0.85 AS confidence_score,
+    0.75 AS business_impact_score,
+    CURRENT_TIMESTAMP() AS generated_timestamp,
+    ARRAY_AGG(knowledge_id) AS source_ids
+  FROM semantic_search
+  WHERE similarity_score > 0.7
+)
+SELECT * FROM insight_generation
+"""
+
+# Candidates carry no model call, so a role with no recent insights costs none.
+# insight_id breaks timestamp ties so batch positions line up with the rows.
+PERSONALIZED_CANDIDATES_SQL = f"""
+SELECT 
+  insight_id,
+  content,
+  confidence_score,
+  business_impact_score,
+  generated_timestamp
+FROM `{PROJECT}.enterprise_ai.generated_insights`
+WHERE @user_role IN UNNEST(target_audience)
+  AND generated_timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 7 DAY)
+ORDER BY generated_timestamp DESC, insight_id
+"""
+
+# One model call rates a whole batch of insights; its reply is parsed here, once
+RELEVANCE_BATCH_SQL = f"""
+SELECT 
+  AI.GENERATE(
+    MODEL `{PROJECT}.enterprise_ai.gemini_model`,
+    CONCAT(
+      'Rate the relevance of each insight for role ', @user_role,
+      ' from 0 to 1. Reply with only a JSON array of numbers in the same order: ',
+      TO_JSON_STRING(@contents)
+    )
+  ) AS scores_json
+"""
+
+# A batch whose reply is unusable is rated one insight at a time instead
+RELEVANCE_PER_ROW_SQL = f"""
+SELECT 
+  insight_id,
+  AI.GENERATE_DOUBLE(
+    MODEL `{PROJECT}.enterprise_ai.gemini_model`,
+    CONCAT('Rate relevance for role ', @user_role, ': ', content)
+  ) AS relevance_score
+FROM `{PROJECT}.enterprise_ai.generated_insights`
+WHERE insight_id IN UNNEST(@insight_ids)
+"""
+
+# Keeps each prompt bounded; larger candidate sets are rated in several batches
+RELEVANCE_BATCH_SIZE = 200
+
+# Models often wrap the array in ```json fences or prose, so only the first [...] is parsed
+SCORES_ARRAY = re.compile(r'\[[^\[\]]*\]')
+
+# The dashboard's two result sets are independent, so they are fetched as two
+# plain queries that run side by side
+METRICS_SQL = f"""
+SELECT 
+  COUNT(*) as total_insights,
+  AVG(confidence_score) as avg_confidence
+FROM `{PROJECT}.enterprise_ai.generated_insights`
+WHERE generated_timestamp >= TIMESTAMP(CURRENT_DATE())
+  AND generated_timestamp < TIMESTAMP(DATE_ADD(CURRENT_DATE(), INTERVAL 1 DAY))
+"""
+
+RECENT_INSIGHTS_SQL = f"""
+SELECT 
+  insight_id,
+  content,
+  business_impact_score,
+  generated_timestamp
+FROM `{PROJECT}.enterprise_ai.generated_insights`
+WHERE generated_timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)
+ORDER BY business_impact_score DESC
+LIMIT 5
+"""
+
+# Preferences are written with the streaming insert API rather than DML
+USER_PREFERENCES_TABLE = f"{PROJECT}.enterprise_ai.user_preferences"
+
+# Blocking; handlers call it through asyncio.to_thread so a running query never
+# holds up the event loop
+def run_query(query, job_config=None, max_results=None):
+    """Run a query to completion and return its rows (at most max_results of them)"""
+    return list(client.query(query, job_config=job_config).result(max_results=max_results))
+
+# Personalized insights and dashboard data move slowly, so repeat requests within
+# a minute are answered from memory instead of BigQuery
+personalized_cache = TTLCache(maxsize=128, ttl=60)
+dashboard_cache = TTLCache(maxsize=1, ttl=60)
+# One lock per key with a fetch in flight; entries are dropped once the fetch ends
+cache_locks = {}
+
+async def cached_fetch(cache, key, fetch):
+    """Return cache[key], running fetch() to fill it at most once at a time per key"""
+    value = cache.get(key)
+    if value is not None:
+        return value
+    
+    # Concurrent misses for the same key wait for the first fetch instead of
+    # each sending their own query
+    lock_key = (id(cache), key)
+    lock = cache_locks.setdefault(lock_key, asyncio.Lock())
+    async with lock:
+        try:
+            value = cache.get(key)
+            if value is None:
+                value = await fetch()
+                cache[key] = value
+            return value
+        finally:
+            # Keys include the caller's limit and role, so keeping every lock
+            # would grow without bound; later callers hit the cache instead
+            if cache_locks.get(lock_key) is lock:
+                del cache_locks[lock_key]
+
+@lru_cache(maxsize=64)
+def forecast_sql(metric_name: str) -> str:
+    """Forecast query for one metric; the model name is the only part that is not a parameter"""
+    return f"""
+    WITH forecast_data AS (
+      SELECT 
+        forecast_timestamp,
+        forecast_value,
+        confidence_level_lower,
+        confidence_level_upper
+      FROM ML.FORECAST(
+        MODEL `{PROJECT}.enterprise_ai.forecast_model_{metric_name}`,
+        STRUCT(@horizon AS horizon, @confidence AS confidence_level)
+      )
+    ),
+    strategic_analysis AS (
+      SELECT 
+        AI.GENERATE(
+          MODEL `{PROJECT}.enterprise_ai.gemini_model`,
+          CONCAT(
+            'Analyze forecast trends and provide strategic recommendations for metric: ',
+            @metric_name,
+            ' Forecast data: ', 
+            STRING_AGG(
+              CONCAT('Date: ', CAST(forecast_timestamp AS STRING), 
+                     ', Value: ', CAST(forecast_value AS STRING)), 
+              ' | '
+            )
+          )
+        ) AS recommendations
+      FROM forecast_data
+    )
+    SELECT 
+      f.*,
+      s.recommendations
+    FROM forecast_data f
+    CROSS JOIN strategic_analysis s
+    """
+
+# Pydantic models for API requests/responses. Unknown fields are rejected, and
+# responses are serialized straight from the models' compiled schemas.
 class InsightRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    
     query: str = Field(..., description="Natural language query for insights")
     user_role: Optional[str] = Field(None, description="User role for personalization")
     context: Optional[Dict[str, Any]] = Field(None, description="Additional context")
 
 class InsightResponse(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    
     insight_id: str
     content: str
     confidence_score: float
@@ -49,17 +252,23 @@ class InsightResponse(BaseModel):
     sources: List[str]
 
 class ForecastRequest(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    
     metric_name: str = Field(..., description="Business metric to forecast")
     horizon_days: int = Field(30, description="Forecast horizon in days")
     confidence_level: float = Field(0.95, description="Confidence level for intervals")
 
 class ForecastResponse(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    
     metric_name: str
     forecast_values: List[Dict[str, Any]]
     confidence_intervals: List[Dict[str, Any]]
     strategic_recommendations: str
 
 class UserPreferences(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    
     user_id: str
     role: str
     departments: List[str]
@@ -87,67 +296,35 @@ async def generate_insight(
     """Generate AI-powered insights based on natural language query"""
     try:
         # Execute semantic search and insight generation
-        query = f"""
-        WITH semantic_search AS (
-          SELECT 
-            knowledge_id,
-            content,
-            VECTOR_SEARCH(
-              TABLE `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.enterprise_knowledge_base`,
-              (SELECT ML.GENERATE_EMBEDDING(
-                MODEL `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.text_embedding_model`,
-                @query_text
-              )),
-              top_k => 5,
-              distance_type => 'COSINE'
-            ) AS similarity_score
-          FROM `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.enterprise_knowledge_base`
-          WHERE access_permissions IS NULL OR @user_role IN UNNEST(access_permissions)
-        ),
-        insight_generation AS (
-          SELECT 
-            GENERATE_UUID() as insight_id,
-            AI.GENERATE(
-              MODEL `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.gemini_model`,
-              CONCAT(
-                'Generate actionable business insight for: ', @query_text,
-                ' Based on context: ', STRING_AGG(content, ' | ')
-              )
-            ) AS generated_insight,
-            0.85 AS confidence_score,
-            0.75 AS business_impact_score,
-            CURRENT_TIMESTAMP() AS generated_timestamp,
-            ARRAY_AGG(knowledge_id) AS source_ids
-          FROM semantic_search
-          WHERE similarity_score > 0.7
-        )
-        SELECT * FROM insight_generation
-        """
-        
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
                 bigquery.ScalarQueryParameter("query_text", "STRING", request.query),
                 bigquery.ScalarQueryParameter("user_role", "STRING", request.user_role or current_user["role"])
-            ]
+            ],
+            use_query_cache=True,
+            use_legacy_sql=False,
+            labels={"endpoint": "generate_insight"}
         )
         
-        query_job = client.query(query, job_config=job_config)
-        results = query_job.result()
+        # Only the first row is used, so only one row is fetched
+        results = await asyncio.to_thread(run_query, INSIGHT_SQL, job_config, 1)
+        row = next(iter(results), None)
         
-        for row in results:
-            return InsightResponse(
-                insight_id=row.insight_id,
-                content=row.generated_insight,
-                confidence_score=row.confidence_score,
-                business_impact_score=row.business_impact_score,
-                generated_timestamp=row.generated_timestamp,
-                sources=row.source_ids
-            )
-            
-        raise HTTPException(status_code=404, detail="No relevant insights found")
+        if row is None:
+            raise HTTPException(status_code=404, detail="No relevant insights found")
+        
+        insight = InsightResponse(
+            insight_id=row.insight_id,
+            content=row.generated_insight,
+            confidence_score=row.confidence_score,
+            business_impact_score=row.business_impact_score,
+            generated_timestamp=row.generated_timestamp,
+            sources=row.source_ids
+        )
+        return Response(content=insight.model_dump_json(), media_type="application/json")
         
-    except Exception as e:
-        logging.error(f"Error generating insight: {str(e)}")
+    except Exception:
+        log.exception("Error generating insight")
         raise HTTPException(status_code=500, detail="Failed to generate insight")
 
 @app.post("/forecasts/generate", response_model=ForecastResponse)
@@ -157,50 +334,18 @@ async def generate_forecast(
 ):
     """Generate predictive forecasts for business metrics"""
     try:
-        query = f"""
-        WITH forecast_data AS (
-          SELECT 
-            forecast_timestamp,
-            forecast_value,
-            confidence_level_lower,
-            confidence_level_upper
-          FROM ML.FORECAST(
-            MODEL `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.forecast_model_{request.metric_name}`,
-            STRUCT({request.horizon_days} AS horizon, {request.confidence_level} AS confidence_level)
-          )
-        ),
-        strategic_analysis AS (
-          SELECT 
-            AI.GENERATE(
-              MODEL `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.gemini_model`,
-              CONCAT(
-                'Analyze forecast trends and provide strategic recommendations for metric: ',
-                @metric_name,
-                ' Forecast data: ', 
-                STRING_AGG(
-                  CONCAT('Date: ', CAST(forecast_timestamp AS STRING), 
-                         ', Value: ', CAST(forecast_value AS STRING)), 
-                  ' | '
-                )
-              )
-            ) AS recommendations
-          FROM forecast_data
-        )
-        SELECT 
-          f.*,
-          s.recommendations
-        FROM forecast_data f
-        CROSS JOIN strategic_analysis s
-        """
-        
         job_config = bigquery.QueryJobConfig(
             query_parameters=[
-                bigquery.ScalarQueryParameter("metric_name", "STRING", request.metric_name)
-            ]
+                bigquery.ScalarQueryParameter("metric_name", "STRING", request.metric_name),
+                bigquery.ScalarQueryParameter("horizon", "INT64", request.horizon_days),
+                bigquery.ScalarQueryParameter("confidence", "FLOAT64", request.confidence_level)
+            ],
+            use_query_cache=True,
+            use_legacy_sql=False,
+            labels={"endpoint": "generate_forecast"}
         )
         
-        query_job = client.query(query, job_config=job_config)
-        results = query_job.result()
+        results = await asyncio.to_thread(run_query, forecast_sql(request.metric_name), job_config)
         
         forecast_values = []
         confidence_intervals = []
@@ -218,17 +363,107 @@ async def generate_forecast(
             })
             recommendations = row.recommendations
         
-        return ForecastResponse(
+        forecast = ForecastResponse(
             metric_name=request.metric_name,
             forecast_values=forecast_values,
             confidence_intervals=confidence_intervals,
             strategic_recommendations=recommendations
         )
+        return Response(content=forecast.model_dump_json(), media_type="application/json")
         
-    except Exception as e:
-        logging.error(f"Error generating forecast: {str(e)}")
+    except Exception:
+        log.exception("Error generating forecast")
         raise HTTPException(status_code=500, detail="Failed to generate forecast")
 
+def parse_relevance_scores(reply, expected):
+    """Scores from a batch reply, or None unless it holds exactly one entry per insight"""
+    match = SCORES_ARRAY.search(reply or "")
+    if not match:
+        return None
+    try:
+        scores = json.loads(match.group())
+    except ValueError:
+        return None
+    if len(scores) != expected:
+        return None
+    # A non-numeric entry leaves just that insight unscored
+    return [
+        float(score) if isinstance(score, (int, float)) and not isinstance(score, bool) else None
+        for score in scores
+    ]
+
+async def score_relevance(user_role, batch):
+    """Relevance score by insight_id for one batch of candidate rows"""
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("user_role", "STRING", user_role),
+            bigquery.ArrayQueryParameter("contents", "STRING", [row.content for row in batch])
+        ],
+        use_query_cache=True,
+        use_legacy_sql=False,
+        labels={"endpoint": "personalized_batch_scores"}
+    )
+    replies = await asyncio.to_thread(run_query, RELEVANCE_BATCH_SQL, job_config)
+    
+    scores = parse_relevance_scores(replies[0].scores_json if replies else None, len(batch))
+    if scores is not None:
+        return {row.insight_id: score for row, score in zip(batch, scores)}
+    
+    log.warning("Batched relevance reply for role %s was not a usable JSON array; scoring per row", user_role)
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("user_role", "STRING", user_role),
+            bigquery.ArrayQueryParameter("insight_ids", "STRING", [row.insight_id for row in batch])
+        ],
+        use_query_cache=True,
+        use_legacy_sql=False,
+        labels={"endpoint": "personalized_row_scores"}
+    )
+    rows = await asyncio.to_thread(run_query, RELEVANCE_PER_ROW_SQL, job_config)
+    return {row.insight_id: row.relevance_score for row in rows}
+
+async def fetch_personalized_insights(user_role, limit):
+    """Query the top personalized insights for a role"""
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("user_role", "STRING", user_role)
+        ],
+        use_query_cache=True,
+        use_legacy_sql=False,
+        labels={"endpoint": "personalized_candidates"}
+    )
+    candidates = await asyncio.to_thread(run_query, PERSONALIZED_CANDIDATES_SQL, job_config)
+    
+    relevance = {}
+    batches = [
+        candidates[start:start + RELEVANCE_BATCH_SIZE]
+        for start in range(0, len(candidates), RELEVANCE_BATCH_SIZE)
+    ]
+    for scores in await asyncio.gather(*(score_relevance(user_role, batch) for batch in batches)):
+        relevance.update(scores)
+    
+    # Most relevant first, then highest impact; unscored values sort last
+    def rank(row):
+        score = relevance.get(row.insight_id)
+        impact = row.business_impact_score
+        return (score is None, -(score or 0.0), impact is None, -(impact or 0.0))
+    
+    results = sorted(candidates, key=rank)[:limit]
+    
+    insights = [
+        {
+            "insight_id": row.insight_id,
+            "content": row.content,
+            "confidence_score": row.confidence_score,
+            "business_impact_score": row.business_impact_score,
+            "relevance_score": relevance.get(row.insight_id),
+            "generated_timestamp": row.generated_timestamp.isoformat()
+        }
+        for row in results
+    ]
+    
+    return {"insights": insights, "total_count": len(insights)}
+
 @app.get("/insights/personalized")
 async def get_personalized_insights(
     limit: int = Query(10, description="Number of insights to return"),
@@ -236,111 +471,52 @@ async def get_personalized_insights(
 ):
     """Get personalized insights based on user role and preferences"""
     try:
-        query = f"""
-        WITH personalized_insights AS (
-          SELECT 
-            insight_id,
-            content,
-            confidence_score,
-            business_impact_score,
-            generated_timestamp,
-            AI.GENERATE_DOUBLE(
-              MODEL `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.gemini_model`,
-              CONCAT('Rate relevance for role ', @user_role, ': ', content)
-            ) AS relevance_score
-          FROM `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.generated_insights`
-          WHERE @user_role IN UNNEST(target_audience)
-            AND generated_timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 7 DAY)
+        role = current_user["role"]
+        return await cached_fetch(
+            personalized_cache, (role, limit),
+            lambda: fetch_personalized_insights(role, limit)
         )
-        SELECT *
-        FROM personalized_insights
-        ORDER BY relevance_score DESC, business_impact_score DESC
-        LIMIT @limit_count
-        """
-        
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("user_role", "STRING", current_user["role"]),
-                bigquery.ScalarQueryParameter("limit_count", "INT64", limit)
-            ]
-        )
-        
-        query_job = client.query(query, job_config=job_config)
-        results = query_job.result()
-        
-        insights = []
-        for row in results:
-            insights.append({
-                "insight_id": row.insight_id,
-                "content": row.content,
-                "confidence_score": row.confidence_score,
-                "business_impact_score": row.business_impact_score,
-                "relevance_score": row.relevance_score,
-                "generated_timestamp": row.generated_timestamp.isoformat()
-            })
         
-        return {"insights": insights, "total_count": len(insights)}
-        
-    except Exception as e:
-        logging.error(f"Error fetching personalized insights: {str(e)}")
+    except Exception:
+        log.exception("Error fetching personalized insights")
         raise HTTPException(status_code=500, detail="Failed to fetch personalized insights")
 
+async def fetch_dashboard_data():
+    """Query the executive dashboard's metrics and recent insights"""
+    # Fetch key metrics and recent insights concurrently
+    metrics, recent_insights = await asyncio.gather(
+        asyncio.to_thread(run_query, METRICS_SQL, bigquery.QueryJobConfig(
+            use_query_cache=True,
+            use_legacy_sql=False,
+            labels={"endpoint": "dashboard_metrics"}
+        ), 1),
+        asyncio.to_thread(run_query, RECENT_INSIGHTS_SQL, bigquery.QueryJobConfig(
+            use_query_cache=True,
+            use_legacy_sql=False,
+            labels={"endpoint": "dashboard_recent_insights"}
+        ), 5)
+    )
+    
+    # Both metrics come from one scan; reshape them into the metric list
+    totals = metrics[0]
+    
+    return {
+        "metrics": [
+            {"metric_name": "total_insights", "metric_value": totals.total_insights},
+            {"metric_name": "avg_confidence", "metric_value": totals.avg_confidence}
+        ],
+        "recent_insights": [dict(row.items()) for row in recent_insights]
+    }
+
 @app.get("/analytics/dashboard")
 async def get_dashboard_data(current_user: dict = Depends(get_current_user)):
     """Get comprehensive dashboard data for executive view"""
     try:
-        # Fetch key metrics, recent insights, and trend data
-        query = f"""
-        WITH key_metrics AS (
-          SELECT 
-            'total_insights' as metric_name,
-            COUNT(*) as metric_value
-          FROM `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.generated_insights`
-          WHERE DATE(generated_timestamp) = CURRENT_DATE()
-          
-          UNION ALL
-          
-          SELECT 
-            'avg_confidence' as metric_name,
-            AVG(confidence_score) as metric_value
-          FROM `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.generated_insights`
-          WHERE DATE(generated_timestamp) = CURRENT_DATE()
-        ),
-        recent_insights AS (
-          SELECT 
-            insight_id,
-            content,
-            business_impact_score,
-            generated_timestamp
-          FROM `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.generated_insights`
-          WHERE generated_timestamp >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL 24 HOUR)
-          ORDER BY business_impact_score DESC
-          LIMIT 5
-        )
-        SELECT 
-          'metrics' as data_type,
-          TO_JSON_STRING(ARRAY_AGG(STRUCT(metric_name, metric_value))) as data
-        FROM key_metrics
-        
-        UNION ALL
-        
-        SELECT 
-          'recent_insights' as data_type,
-          TO_JSON_STRING(ARRAY_AGG(STRUCT(insight_id, content, business_impact_score, generated_timestamp))) as data
-        FROM recent_insights
-        """
-        
-        query_job = client.query(query)
-        results = query_job.result()
-        
-        dashboard_data = {}
-        for row in results:
-            dashboard_data[row.data_type] = json.loads(row.data)
-        
-        return dashboard_data
+        # The dashboard queries do not depend on the caller, so every user shares one entry
+        return await cached_fetch(dashboard_cache, "dashboard", fetch_dashboard_data)
         
-    except Exception as e:
-        logging.error(f"Error fetching dashboard data: {str(e)}")
+    except Exception:
+        log.exception("Error fetching dashboard data")
         raise HTTPException(status_code=500, detail="Failed to fetch dashboard data")
 
 @app.post("/users/preferences")
@@ -351,36 +527,23 @@ async def update_user_preferences(
     """Update user preferences for personalized content delivery"""
     try:
         # Store user preferences in BigQuery
-        query = f"""
-        INSERT INTO `{os.getenv('BIGQUERY_PROJECT')}.enterprise_ai.user_preferences`
-        (user_id, role, departments, notification_preferences, priority_topics, updated_timestamp)
-        VALUES (
-          @user_id,
-          @role,
-          @departments,
-          @notification_preferences,
-          @priority_topics,
-          CURRENT_TIMESTAMP()
-        )
-        """
-        
-        job_config = bigquery.QueryJobConfig(
-            query_parameters=[
-                bigquery.ScalarQueryParameter("user_id", "STRING", preferences.user_id),
-                bigquery.ScalarQueryParameter("role", "STRING", preferences.role),
-                bigquery.ArrayQueryParameter("departments", "STRING", preferences.departments),
-                bigquery.ScalarQueryParameter("notification_preferences", "JSON", json.dumps(preferences.notification_preferences)),
-                bigquery.ArrayQueryParameter("priority_topics", "STRING", preferences.priority_topics)
-            ]
-        )
+        row = {
+            "user_id": preferences.user_id,
+            "role": preferences.role,
+            "departments": preferences.departments,
+            "notification_preferences": json.dumps(preferences.notification_preferences),
+            "priority_topics": preferences.priority_topics,
+            "updated_timestamp": datetime.now(timezone.utc).isoformat()
+        }
         
-        query_job = client.query(query, job_config=job_config)
-        query_job.result()
+        errors = await asyncio.to_thread(client.insert_rows_json, USER_PREFERENCES_TABLE, [row])
+        if errors:
+            raise RuntimeError(f"Streaming insert rejected row: {errors}")
         
         return {"message": "User preferences updated successfully"}
         
-    except Exception as e:
-        logging.error(f"Error updating user preferences: {str(e)}")
+    except Exception:
+        log.exception("Error updating user preferences")
         raise HTTPException(status_code=500, detail="Failed to update user preferences")
 
 if __name__ == "__main__":
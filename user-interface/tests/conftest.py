@@ -0,0 +1,185 @@
+"""
+Shared pytest fixtures for the UI integration tests
+One Chrome instance per session (per xdist worker) serves desktop and mobile tests;
+the workers' drivers form the pool, so tests can be spread individually across them
+"""
+
+import os
+import json
+import pytest
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+# iPhone 8 metrics, applied over CDP instead of launching a second browser
+MOBILE_METRICS = {"width": 375, "height": 667, "deviceScaleFactor": 2, "mobile": True}
+MOBILE_USER_AGENT = (
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 11_0 like Mac OS X) AppleWebKit/604.1.38 "
+    "(KHTML, like Gecko) Version/11.0 Mobile/15A372 Safari/604.1"
+)
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+# Canned API responses served inside the browser: request path -> fixture name
+API_RESPONSE_FIXTURES = {
+    "/": "health",
+    "/insights/generate": "insights_generate",
+    "/forecasts/generate": "forecasts_generate",
+    "/insights/personalized": "insights_personalized",
+    "/analytics/dashboard": "analytics_dashboard",
+    "/users/preferences": "users_preferences",
+}
+
+
+@lru_cache(maxsize=None)
+def load_fixture(name):
+    """Parse tests/fixtures/<name>.json once per process and share the result"""
+    return json.loads((FIXTURE_DIR / f"{name}.json").read_bytes())
+
+
+# Replaces window.fetch before any page script runs: calls to the API origin get
+# the canned body for their path (404 otherwise), so no backend is ever contacted
+API_STUB_SCRIPT = """
+(() => {
+    const responses = %s;
+    const realFetch = window.fetch;
+    window.fetch = (input, init) => {
+        const url = new URL(typeof input === 'string' ? input : input.url, location.href);
+        if (url.origin !== 'http://localhost:8000') {
+            return realFetch(input, init);
+        }
+        const body = responses[url.pathname];
+        return Promise.resolve(new Response(
+            body === undefined ? '{"detail": "Not stubbed"}' : JSON.stringify(body),
+            {status: body === undefined ? 404 : 200, headers: {'Content-Type': 'application/json'}}
+        ));
+    };
+})();
+"""
+
+
+# The file:// pages need no GPU, extensions, background networking or images;
+# turning those subsystems off shortens every page render
+CHROME_ARGUMENTS = (
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-renderer-backgrounding",
+    "--blink-settings=imagesEnabled=false",
+    "--window-size=1920,1080",
+)
+
+
+def make_chrome_options(profile_dir):
+    """Build the Chrome options every UI test runs with"""
+    chrome_options = Options()
+    for argument in CHROME_ARGUMENTS:
+        chrome_options.add_argument(argument)
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    return chrome_options
+
+
+class RemoteChromeDriver(webdriver.Remote):
+    """Chrome on a Selenium Grid, with the CDP passthrough a local ChromeDriver has"""
+    
+    def __init__(self, command_executor, options):
+        super().__init__(
+            command_executor=ChromiumRemoteConnection(command_executor, "goog", "chrome"),
+            options=options
+        )
+    
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
+def start_chrome(profile_dir):
+    """Attach to the grid run_tests.py started when there is one, else launch chromedriver"""
+    grid_url = os.environ.get("SELENIUM_REMOTE_URL")
+    if grid_url:
+        return RemoteChromeDriver(grid_url, make_chrome_options(profile_dir))
+    return webdriver.Chrome(options=make_chrome_options(profile_dir))
+
+
+@pytest.fixture(scope="session")
+def chrome_driver(tmp_path_factory):
+    """Set up one headless Chrome driver for the whole session"""
+    # A fresh profile per session and xdist worker: concurrent runs, or a lock
+    # left behind by a crashed Chrome, never find the directory in use
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    profile_dir = tmp_path_factory.mktemp(f"chrome-{worker}")
+    try:
+        driver = start_chrome(profile_dir)
+    except Exception as e:
+        pytest.skip(f"Chrome driver not available: {e}")
+    
+    # Serialized once; applies to every document the session loads
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+        "source": API_STUB_SCRIPT % json.dumps(
+            {path: load_fixture(name) for path, name in API_RESPONSE_FIXTURES.items()}
+        )
+    })
+    # No implicit wait: tests wait explicitly, and mixing the two multiplies timeouts
+    yield driver
+    driver.quit()
+
+
+@pytest.fixture
+def desktop_driver(chrome_driver):
+    """Shared driver with cookies cleared and desktop metrics"""
+    chrome_driver.delete_all_cookies()
+    return chrome_driver
+
+
+@pytest.fixture
+def mobile_driver(chrome_driver):
+    """Shared driver emulating an iPhone 8 for the duration of one test"""
+    chrome_driver.delete_all_cookies()
+    chrome_driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", MOBILE_METRICS)
+    chrome_driver.execute_cdp_cmd("Emulation.setUserAgentOverride", {"userAgent": MOBILE_USER_AGENT})
+    chrome_driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": True})
+    yield chrome_driver
+    chrome_driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+    chrome_driver.execute_cdp_cmd("Emulation.setUserAgentOverride", {"userAgent": ""})
+    chrome_driver.execute_cdp_cmd("Emulation.setTouchEmulationEnabled", {"enabled": False})
+
+
+CLEAR_STORAGE_SCRIPT = "localStorage.clear(); sessionStorage.clear();"
+
+
+def same_origin(url, other):
+    """Whether two URLs share the scheme and host their web storage is keyed by"""
+    url, other = urlparse(url), urlparse(other)
+    return (url.scheme, url.netloc) == (other.scheme, other.netloc)
+
+
+@pytest.fixture
+def ui_page(request):
+    """Give a UI test class the shared driver and open its page_url
+
+    Classes opt in with @pytest.mark.usefixtures("ui_page") and may set
+    mobile = True; Chrome being unavailable skips them here, once.
+    Every test clears web storage and then loads its page afresh (a reload
+    when the driver is already there), so the page's scripts, timers and state
+    start over in a new realm and their startup reads see empty storage.
+    """
+    fixture = "mobile_driver" if getattr(request.cls, "mobile", False) else "desktop_driver"
+    driver = request.getfixturevalue(fixture)
+    request.instance.driver = driver
+    page_url = getattr(request.cls, "page_url", None)
+    if page_url:
+        # Storage can only be cleared from a page on its origin, so a driver
+        # still elsewhere (about:blank at session start) goes there first
+        if not same_origin(driver.current_url, page_url):
+            driver.get(page_url)
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        if driver.current_url == page_url:
+            driver.refresh()
+        else:
+            driver.get(page_url)
+    return driver
@@ -3,172 +3,227 @@ Integration Tests for Enterprise Knowledge Intelligence User Interface
 Tests API endpoints, dashboard functionality, and mobile interface
 """
 
+import os
+import sys
 import pytest
-import requests
 import json
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
+from datetime import datetime, timezone
+from fastapi.testclient import TestClient
+from google.cloud.bigquery import Row
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException
-import unittest
-from unittest.mock import patch, MagicMock
-
-class APIIntegrationTests(unittest.TestCase):
-    """Test API endpoints functionality"""
-    
-    def setUp(self):
-        self.base_url = "http://localhost:8000"
-        self.auth_token = "demo-token"
-        self.headers = {
-            "Authorization": f"Bearer {self.auth_token}",
-            "Content-Type": "application/json"
-        }
-    
-    def test_api_health_check(self):
-        """Test API health check endpoint"""
-        response = requests.get(f"{self.base_url}/")
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertIn("message", data)
-        self.assertEqual(data["status"], "active")
-    
-    def test_generate_insight_endpoint(self):
-        """Test insight generation endpoint"""
-        payload = {
+from unittest.mock import patch
+from locators import (
+    css, NAVBAR, METRIC_CARDS, GENERATE_INSIGHT_BTN, BUTTONS, LINKS, INPUTS, INSIGHT_MODAL,
+    INSIGHT_QUERY, CONTEXT_SELECT, CREATE_FORECAST_BTN, FORECAST_MODAL, METRIC_SELECT,
+    HORIZON_INPUT, CONFIDENCE_INPUT, DROPDOWN_TOGGLE, DROPDOWN_MENU,
+    ANALYST_WORKBENCH_LINK, SIDEBAR, MAIN_CONTENT, QUERY_INPUT, ANALYSIS_TYPE,
+    TIME_RANGE, PREDICTIVE_OPTION, DATA_SOURCE_LINKS, ANALYSIS_TOOL_LINKS,
+    SEMANTIC_SEARCH_LINK, TABLE_SELECT, SEARCH_FILTER, KNOWLEDGE_BASE_OPTION,
+    VIZ_CHART_BTN, VIZ_TABLE_BTN, NAV_DASHBOARD, NAV_INSIGHTS, NAV_SEARCH, NAV_ALERTS,
+    INSIGHTS_SECTION, NAVBAR_TOGGLER, MOBILE_MENU, MOBILE_MENU_ITEMS,
+    MOBILE_SEARCH_INPUT, MOBILE_SEARCH_TYPE, MOBILE_SEARCH_BTN, MOBILE_INSIGHT_MODAL,
+    MOBILE_INSIGHT_QUERY,
+)
+
+API_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "api")
+
+
+@pytest.fixture(scope="module")
+def api():
+    """Import the API app with its BigQuery client replaced by a mock"""
+    sys.path.insert(0, API_DIR)
+    with patch("google.cloud.bigquery.Client"):
+        import main
+    return main
+
+
+@pytest.fixture(scope="module")
+def api_client(api):
+    """Call the API app in-process, without a server or socket"""
+    return TestClient(api.app)
+
+
+def bq_row(**fields):
+    """Build a BigQuery result row from keyword fields"""
+    return Row(tuple(fields.values()), {name: i for i, name in enumerate(fields)})
+
+
+class FakeQueryJob:
+    """Finished BigQuery job that hands back canned rows"""
+    __slots__ = ("rows",)
+    
+    def __init__(self, rows):
+        self.rows = rows
+    
+    def result(self, max_results=None):
+        return self.rows[:max_results]
+
+
+# Checks every selector's visibility (and counts one) in a single WebDriver round trip
+PROBE_SCRIPT = """
+    const shown = e => !!e && e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden';
+    const visible = arguments[0].map(selector => shown(document.querySelector(selector)));
+    const count = arguments[1] ? document.querySelectorAll(arguments[1]).length : 0;
+    return [visible, count];
+"""
+
+
+# Computed text colors of the first N paragraphs and headings, grouped by tag
+TEXT_STYLES_SCRIPT = """
+    return ['p', 'h1', 'h2', 'h3']
+        .flatMap(tag => [...document.getElementsByTagName(tag)])
+        .slice(0, arguments[0])
+        .map(e => {
+            const style = getComputedStyle(e);
+            return {
+                color: style.color,
+                background_color: style.backgroundColor,
+                text: e.innerText.trim(),
+                visible: e.getClientRects().length > 0 && style.visibility !== 'hidden'
+            };
+        });
+"""
+
+
+# Visible text and aria-label of the first N elements matching a selector
+LABELS_SCRIPT = """
+    return [...document.querySelectorAll(arguments[0])]
+        .slice(0, arguments[1])
+        .filter(e => e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden')
+        .map(e => ({text: e.innerText.trim(), aria_label: e.getAttribute('aria-label')}));
+"""
+
+
+# Focuses each visible element among the first N matches, in selector order,
+# and reports whether it became the active element
+FOCUS_SCRIPT = """
+    return arguments[0]
+        .flatMap(selector => [...document.querySelectorAll(selector)])
+        .slice(0, arguments[1])
+        .filter(e => e.getClientRects().length > 0 && getComputedStyle(e).visibility !== 'hidden')
+        .map(e => {
+            e.focus();
+            return document.activeElement === e;
+        });
+"""
+
+
+def probe(driver, selectors, count_selector=None):
+    """Return each CSS selector's visibility and how many elements match count_selector"""
+    return driver.execute_script(PROBE_SCRIPT, list(selectors), count_selector)
+
+
+@pytest.fixture
+def auth_headers():
+    """Bearer headers the API's demo authentication accepts"""
+    return {
+        "Authorization": "Bearer demo-token",
+        "Content-Type": "application/json"
+    }
+
+
+@pytest.fixture
+def stub_queries(api):
+    """Start from empty caches and a fresh BigQuery mock; returns a function
+    that answers each query with canned rows keyed by its endpoint label"""
+    api.personalized_cache.clear()
+    api.dashboard_cache.clear()
+    api.client.reset_mock(return_value=True, side_effect=True)
+    api.client.insert_rows_json.return_value = []
+    
+    def stub(rows_by_endpoint):
+        api.client.query.side_effect = lambda sql, job_config=None: FakeQueryJob(
+            rows_by_endpoint[job_config.labels["endpoint"]]
+        )
+    return stub
+
+
+# Test API endpoints functionality:
+# (method, path, payload, canned rows by job label, expected keys, expected values)
+API_ENDPOINT_CASES = [
+    pytest.param(
+        "GET", "/", None, {},
+        ["message", "status"], {"status": "active"},
+        id="health_check"
+    ),
+    pytest.param(
+        "POST", "/insights/generate",
+        {
             "query": "What are the key revenue trends for this quarter?",
             "user_role": "executive",
             "context": {"type": "financial"}
-        }
-        
-        with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "insight_id": "test_insight_123",
-                "content": "Revenue shows positive growth trend of 15% this quarter",
-                "confidence_score": 0.92,
-                "business_impact_score": 0.85,
-                "generated_timestamp": "2024-01-15T10:30:00Z",
-                "sources": ["source_1", "source_2"]
-            }
-            mock_post.return_value = mock_response
-            
-            response = requests.post(
-                f"{self.base_url}/insights/generate",
-                headers=self.headers,
-                json=payload
-            )
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            self.assertIn("insight_id", data)
-            self.assertIn("content", data)
-            self.assertGreater(data["confidence_score"], 0.8)
-    
-    def test_generate_forecast_endpoint(self):
-        """Test forecast generation endpoint"""
-        payload = {
+        },
+        {"generate_insight": [bq_row(
+            insight_id="test_insight_123",
+            generated_insight="Revenue shows positive growth trend of 15% this quarter",
+            confidence_score=0.92,
+            business_impact_score=0.85,
+            generated_timestamp=datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc),
+            source_ids=["source_1", "source_2"]
+        )]},
+        ["insight_id", "content", "confidence_score"], {"confidence_score": 0.92},
+        id="generate_insight"
+    ),
+    pytest.param(
+        "POST", "/forecasts/generate",
+        {
             "metric_name": "revenue",
             "horizon_days": 30,
             "confidence_level": 0.95
-        }
-        
-        with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "metric_name": "revenue",
-                "forecast_values": [
-                    {"timestamp": "2024-01-16T00:00:00Z", "value": 100000},
-                    {"timestamp": "2024-01-17T00:00:00Z", "value": 102000}
-                ],
-                "confidence_intervals": [
-                    {"timestamp": "2024-01-16T00:00:00Z", "lower": 95000, "upper": 105000},
-                    {"timestamp": "2024-01-17T00:00:00Z", "lower": 97000, "upper": 107000}
-                ],
-                "strategic_recommendations": "Revenue forecast shows steady growth"
-            }
-            mock_post.return_value = mock_response
-            
-            response = requests.post(
-                f"{self.base_url}/forecasts/generate",
-                headers=self.headers,
-                json=payload
+        },
+        {"generate_forecast": [
+            bq_row(
+                forecast_timestamp=datetime(2024, 1, 16, tzinfo=timezone.utc),
+                forecast_value=100000,
+                confidence_level_lower=95000,
+                confidence_level_upper=105000,
+                recommendations="Revenue forecast shows steady growth"
+            ),
+            bq_row(
+                forecast_timestamp=datetime(2024, 1, 17, tzinfo=timezone.utc),
+                forecast_value=102000,
+                confidence_level_lower=97000,
+                confidence_level_upper=107000,
+                recommendations="Revenue forecast shows steady growth"
             )
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            self.assertEqual(data["metric_name"], "revenue")
-            self.assertIn("forecast_values", data)
-            self.assertIn("strategic_recommendations", data)
-    
-    def test_personalized_insights_endpoint(self):
-        """Test personalized insights endpoint"""
-        with patch('requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "insights": [
-                    {
-                        "insight_id": "insight_1",
-                        "content": "Customer satisfaction scores improved by 12%",
-                        "confidence_score": 0.89,
-                        "business_impact_score": 0.76,
-                        "relevance_score": 0.94,
-                        "generated_timestamp": "2024-01-15T09:00:00Z"
-                    }
-                ],
-                "total_count": 1
-            }
-            mock_get.return_value = mock_response
-            
-            response = requests.get(
-                f"{self.base_url}/insights/personalized?limit=10",
-                headers=self.headers
-            )
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            self.assertIn("insights", data)
-            self.assertIn("total_count", data)
-    
-    def test_dashboard_data_endpoint(self):
-        """Test dashboard data endpoint"""
-        with patch('requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "metrics": [
-                    {"metric_name": "total_insights", "metric_value": 25},
-                    {"metric_name": "avg_confidence", "metric_value": 0.87}
-                ],
-                "recent_insights": [
-                    {
-                        "insight_id": "recent_1",
-                        "content": "Market share increased by 3%",
-                        "business_impact_score": 0.82,
-                        "generated_timestamp": "2024-01-15T11:00:00Z"
-                    }
-                ]
-            }
-            mock_get.return_value = mock_response
-            
-            response = requests.get(
-                f"{self.base_url}/analytics/dashboard",
-                headers=self.headers
-            )
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            self.assertIn("metrics", data)
-            self.assertIn("recent_insights", data)
-    
-    def test_user_preferences_endpoint(self):
-        """Test user preferences update endpoint"""
-        payload = {
+        ]},
+        ["metric_name", "forecast_values", "strategic_recommendations"], {"metric_name": "revenue"},
+        id="generate_forecast"
+    ),
+    pytest.param(
+        "GET", "/insights/personalized?limit=10", None,
+        {
+            "personalized_candidates": [bq_row(
+                insight_id="insight_1",
+                content="Customer satisfaction scores improved by 12%",
+                confidence_score=0.89,
+                business_impact_score=0.76,
+                generated_timestamp=datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+            )],
+            "personalized_batch_scores": [bq_row(scores_json="[0.94]")]
+        },
+        ["insights", "total_count"], {"total_count": 1},
+        id="personalized_insights"
+    ),
+    pytest.param(
+        "GET", "/analytics/dashboard", None,
+        {
+            "dashboard_metrics": [bq_row(total_insights=25, avg_confidence=0.87)],
+            "dashboard_recent_insights": [bq_row(
+                insight_id="recent_1",
+                content="Market share increased by 3%",
+                business_impact_score=0.82,
+                generated_timestamp=datetime(2024, 1, 15, 11, 0, tzinfo=timezone.utc)
+            )]
+        },
+        ["metrics", "recent_insights"], {},
+        id="dashboard_data"
+    ),
+    pytest.param(
+        "POST", "/users/preferences",
+        {
             "user_id": "test_user",
             "role": "analyst",
             "departments": ["finance", "operations"],
@@ -177,290 +232,255 @@ class APIIntegrationTests(unittest.TestCase):
                 "push": False
             },
             "priority_topics": ["revenue", "costs"]
-        }
-        
-        with patch('requests.post') as mock_post:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "message": "User preferences updated successfully"
-            }
-            mock_post.return_value = mock_response
-            
-            response = requests.post(
-                f"{self.base_url}/users/preferences",
-                headers=self.headers,
-                json=payload
-            )
-            
-            self.assertEqual(response.status_code, 200)
-            data = response.json()
-            self.assertIn("message", data)
+        },
+        {},
+        ["message"], {},
+        id="user_preferences"
+    ),
+]
+
+
+@pytest.mark.api
+@pytest.mark.parametrize("method, path, payload, rows, expected_keys, expected_values", API_ENDPOINT_CASES)
+def test_api_endpoint(api_client, auth_headers, stub_queries, method, path, payload, rows, expected_keys, expected_values):
+    """Test each API endpoint against the in-process app with BigQuery stubbed"""
+    stub_queries(rows)
+    
+    response = api_client.request(method, path, headers=auth_headers, json=payload)
+    
+    assert response.status_code == 200
+    data = response.json()
+    for key in expected_keys:
+        assert key in data
+    for key, value in expected_values.items():
+        assert data[key] == value
+
+
+PERSONALIZED_CANDIDATES = [
+    bq_row(
+        insight_id=insight_id,
+        content=content,
+        confidence_score=0.8,
+        business_impact_score=0.7,
+        generated_timestamp=datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+    )
+    for insight_id, content in [("insight_a", "Churn fell 4%"), ("insight_b", "Margins rose 2%")]
+]
 
 
-class DashboardUITests(unittest.TestCase):
+# Batch replies, and the relevance scores they should produce per insight. The
+# per-row fallback rates insight_a 0.8 and insight_b 0.3.
+@pytest.mark.api
+@pytest.mark.parametrize("reply, expected_scores", [
+    pytest.param("```json\n[0.2, 0.9]\n```", {"insight_b": 0.9, "insight_a": 0.2}, id="fenced_reply"),
+    pytest.param("Here are the ratings: [0.9]", {"insight_a": 0.8, "insight_b": 0.3}, id="mismatched_length"),
+    pytest.param("I cannot rate these insights.", {"insight_a": 0.8, "insight_b": 0.3}, id="no_array"),
+])
+def test_personalized_relevance_reply(api_client, auth_headers, stub_queries, reply, expected_scores):
+    """Test batch replies are parsed from fenced text, and unusable ones fall back to per-row scoring"""
+    stub_queries({
+        "personalized_candidates": PERSONALIZED_CANDIDATES,
+        "personalized_batch_scores": [bq_row(scores_json=reply)],
+        "personalized_row_scores": [
+            bq_row(insight_id="insight_a", relevance_score=0.8),
+            bq_row(insight_id="insight_b", relevance_score=0.3)
+        ]
+    })
+    
+    response = api_client.get("/insights/personalized?limit=10", headers=auth_headers)
+    
+    assert response.status_code == 200
+    insights = response.json()["insights"]
+    # Ranked by relevance, highest first
+    assert {i["insight_id"]: i["relevance_score"] for i in insights} == expected_scores
+    assert [i["insight_id"] for i in insights] == list(expected_scores)
+
+
+@pytest.mark.api
+def test_personalized_insights_without_candidates(api, api_client, auth_headers, stub_queries):
+    """Test a role with no recent insights makes no model call"""
+    stub_queries({"personalized_candidates": []})
+    
+    response = api_client.get("/insights/personalized?limit=10", headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert response.json() == {"insights": [], "total_count": 0}
+    assert api.client.query.call_count == 1
+
+
+@pytest.mark.ui
+@pytest.mark.usefixtures("ui_page")
+class DashboardUITests:
     """Test executive dashboard user interface"""
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up Chrome driver for UI testing"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  # Run in headless mode
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        try:
-            cls.driver = webdriver.Chrome(options=chrome_options)
-            cls.driver.implicitly_wait(10)
-        except Exception as e:
-            pytest.skip(f"Chrome driver not available: {e}")
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up driver"""
-        if hasattr(cls, 'driver'):
-            cls.driver.quit()
-    
-    def setUp(self):
-        """Navigate to dashboard before each test"""
-        if hasattr(self, 'driver'):
-            self.driver.get("file:///user-interface/dashboard/index.html")
+    page_url = "file:///user-interface/dashboard/index.html"
     
     def test_dashboard_loads(self):
         """Test that dashboard loads successfully"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Check page title
-        self.assertIn("Executive Dashboard", self.driver.title)
+        assert "Executive Dashboard" in self.driver.title
         
-        # Check main elements are present
-        navbar = self.driver.find_element(By.CLASS_NAME, "navbar")
-        self.assertTrue(navbar.is_displayed())
-        
-        metric_cards = self.driver.find_elements(By.CLASS_NAME, "metric-card")
-        self.assertEqual(len(metric_cards), 4)
+        # Check the navbar is shown and all 4 metric cards are present
+        WebDriverWait(self.driver, 2).until(
+            lambda d: probe(d, [".navbar"], ".metric-card") == [[True], 4]
+        )
     
     def test_metric_cards_display(self):
         """Test that metric cards display correctly"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
-        # Check all metric cards are present
-        insights_card = self.driver.find_element(By.ID, "totalInsights")
-        confidence_card = self.driver.find_element(By.ID, "avgConfidence")
-        alerts_card = self.driver.find_element(By.ID, "activeAlerts")
-        forecast_card = self.driver.find_element(By.ID, "forecastAccuracy")
-        
-        # Verify cards are visible
-        self.assertTrue(insights_card.is_displayed())
-        self.assertTrue(confidence_card.is_displayed())
-        self.assertTrue(alerts_card.is_displayed())
-        self.assertTrue(forecast_card.is_displayed())
+        # Verify all metric cards are present and visible
+        visible, _ = probe(self.driver, ["#totalInsights", "#avgConfidence", "#activeAlerts", "#forecastAccuracy"])
+        assert all(visible)
     
     def test_insight_generation_modal(self):
         """Test insight generation modal functionality"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Click generate insight button
-        generate_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Generate New Insight')]")
+        generate_btn = self.driver.find_element(*GENERATE_INSIGHT_BTN)
         generate_btn.click()
         
         # Wait for modal to appear
         wait = WebDriverWait(self.driver, 10)
-        modal = wait.until(EC.visibility_of_element_located((By.ID, "insightModal")))
+        modal = wait.until(EC.visibility_of_element_located(INSIGHT_MODAL))
         
         # Check modal elements
-        query_input = self.driver.find_element(By.ID, "insightQuery")
-        context_select = self.driver.find_element(By.ID, "contextSelect")
+        query_input = self.driver.find_element(*INSIGHT_QUERY)
+        context_select = self.driver.find_element(*CONTEXT_SELECT)
         
-        self.assertTrue(query_input.is_displayed())
-        self.assertTrue(context_select.is_displayed())
+        assert query_input.is_displayed()
+        assert context_select.is_displayed()
         
         # Test form interaction
         query_input.send_keys("Test insight query")
-        self.assertEqual(query_input.get_attribute("value"), "Test insight query")
+        assert query_input.get_attribute("value") == "Test insight query"
     
     def test_forecast_modal(self):
         """Test forecast creation modal"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Click create forecast button
-        forecast_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Create Forecast')]")
+        forecast_btn = self.driver.find_element(*CREATE_FORECAST_BTN)
         forecast_btn.click()
         
         # Wait for modal to appear
         wait = WebDriverWait(self.driver, 10)
-        modal = wait.until(EC.visibility_of_element_located((By.ID, "forecastModal")))
+        modal = wait.until(EC.visibility_of_element_located(FORECAST_MODAL))
         
         # Check modal elements
-        metric_select = self.driver.find_element(By.ID, "metricSelect")
-        horizon_input = self.driver.find_element(By.ID, "horizonInput")
-        confidence_input = self.driver.find_element(By.ID, "confidenceInput")
-        
-        self.assertTrue(metric_select.is_displayed())
-        self.assertTrue(horizon_input.is_displayed())
-        self.assertTrue(confidence_input.is_displayed())
+        visible, _ = probe(self.driver, [css(METRIC_SELECT), css(HORIZON_INPUT), css(CONFIDENCE_INPUT)])
+        assert all(visible)
     
     def test_navigation_menu(self):
         """Test navigation menu functionality"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Test dropdown menu
-        dropdown = self.driver.find_element(By.CLASS_NAME, "dropdown-toggle")
+        dropdown = self.driver.find_element(*DROPDOWN_TOGGLE)
         dropdown.click()
         
         # Wait for dropdown menu to appear
         wait = WebDriverWait(self.driver, 10)
-        dropdown_menu = wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "dropdown-menu")))
+        dropdown_menu = wait.until(EC.visibility_of_element_located(DROPDOWN_MENU))
         
         # Check menu items
-        analyst_link = self.driver.find_element(By.XPATH, "//a[contains(text(), 'Analyst Workbench')]")
-        self.assertTrue(analyst_link.is_displayed())
+        analyst_link = self.driver.find_element(*ANALYST_WORKBENCH_LINK)
+        assert analyst_link.is_displayed()
     
     def test_responsive_design(self):
         """Test responsive design at different screen sizes"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
-        # Test mobile size
-        self.driver.set_window_size(375, 667)  # iPhone size
-        time.sleep(1)
-        
-        # Check that elements are still visible
-        navbar = self.driver.find_element(By.CLASS_NAME, "navbar")
-        self.assertTrue(navbar.is_displayed())
-        
-        # Test tablet size
-        self.driver.set_window_size(768, 1024)  # iPad size
-        time.sleep(1)
-        
-        metric_cards = self.driver.find_elements(By.CLASS_NAME, "metric-card")
-        self.assertTrue(len(metric_cards) > 0)
-        
-        # Reset to desktop size
-        self.driver.set_window_size(1920, 1080)
+        try:
+            # Test mobile size; CDP applies the metrics synchronously
+            self.driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": 375, "height": 667, "deviceScaleFactor": 2, "mobile": True  # iPhone size
+            })
+            WebDriverWait(self.driver, 2).until(lambda d: d.execute_script("return window.innerWidth") == 375)
+            
+            # Check that elements are still visible
+            navbar = self.driver.find_element(*NAVBAR)
+            assert navbar.is_displayed()
+            
+            # Test tablet size
+            self.driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": 768, "height": 1024, "deviceScaleFactor": 2, "mobile": True  # iPad size
+            })
+            WebDriverWait(self.driver, 2).until(lambda d: d.execute_script("return window.innerWidth") == 768)
+            
+            metric_cards = self.driver.find_elements(*METRIC_CARDS)
+            assert len(metric_cards) > 0
+        finally:
+            # Reset to desktop size for the next test on the shared driver
+            self.driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
 
 
-class AnalystWorkbenchTests(unittest.TestCase):
+@pytest.mark.ui
+@pytest.mark.usefixtures("ui_page")
+class AnalystWorkbenchTests:
     """Test analyst workbench functionality"""
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up Chrome driver for UI testing"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1920,1080")
-        
-        try:
-            cls.driver = webdriver.Chrome(options=chrome_options)
-            cls.driver.implicitly_wait(10)
-        except Exception as e:
-            pytest.skip(f"Chrome driver not available: {e}")
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up driver"""
-        if hasattr(cls, 'driver'):
-            cls.driver.quit()
-    
-    def setUp(self):
-        """Navigate to analyst workbench before each test"""
-        if hasattr(self, 'driver'):
-            self.driver.get("file:///user-interface/dashboard/analyst.html")
+    page_url = "file:///user-interface/dashboard/analyst.html"
     
     def test_workbench_loads(self):
         """Test that analyst workbench loads successfully"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Check page title
-        self.assertIn("Analyst Workbench", self.driver.title)
+        assert "Analyst Workbench" in self.driver.title
         
         # Check main components
-        sidebar = self.driver.find_element(By.CLASS_NAME, "sidebar")
-        main_content = self.driver.find_element(By.CLASS_NAME, "main-content")
-        
-        self.assertTrue(sidebar.is_displayed())
-        self.assertTrue(main_content.is_displayed())
+        visible, _ = probe(self.driver, [css(SIDEBAR), css(MAIN_CONTENT)])
+        assert all(visible)
     
     def test_query_builder(self):
         """Test query builder functionality"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Find query input
-        query_input = self.driver.find_element(By.ID, "queryInput")
-        analysis_type = self.driver.find_element(By.ID, "analysisType")
-        time_range = self.driver.find_element(By.ID, "timeRange")
+        query_input = self.driver.find_element(*QUERY_INPUT)
+        analysis_type = self.driver.find_element(*ANALYSIS_TYPE)
+        time_range = self.driver.find_element(*TIME_RANGE)
         
         # Test form interaction
         query_input.send_keys("Analyze revenue trends for Q4")
-        self.assertEqual(query_input.get_attribute("value"), "Analyze revenue trends for Q4")
+        assert query_input.get_attribute("value") == "Analyze revenue trends for Q4"
         
         # Test dropdown selections
         analysis_type.click()
-        predictive_option = self.driver.find_element(By.XPATH, "//option[@value='predictive']")
+        predictive_option = self.driver.find_element(*PREDICTIVE_OPTION)
         predictive_option.click()
         
-        self.assertEqual(analysis_type.get_attribute("value"), "predictive")
+        assert analysis_type.get_attribute("value") == "predictive"
     
     def test_sidebar_navigation(self):
         """Test sidebar navigation"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Test data source links
-        data_sources = self.driver.find_elements(By.XPATH, "//a[contains(@onclick, 'loadDataSource')]")
-        self.assertTrue(len(data_sources) > 0)
+        data_sources = self.driver.find_elements(*DATA_SOURCE_LINKS)
+        assert len(data_sources) > 0
         
         # Test analysis tools
-        analysis_tools = self.driver.find_elements(By.XPATH, "//a[contains(@onclick, 'show')]")
-        self.assertTrue(len(analysis_tools) > 0)
+        analysis_tools = self.driver.find_elements(*ANALYSIS_TOOL_LINKS)
+        assert len(analysis_tools) > 0
         
         # Click on semantic search
-        semantic_search = self.driver.find_element(By.XPATH, "//a[contains(@onclick, 'showSemanticSearch')]")
+        semantic_search = self.driver.find_element(*SEMANTIC_SEARCH_LINK)
         semantic_search.click()
         
         # Verify analysis type changed
-        analysis_type = self.driver.find_element(By.ID, "analysisType")
-        self.assertEqual(analysis_type.get_attribute("value"), "semantic")
+        analysis_type = self.driver.find_element(*ANALYSIS_TYPE)
+        assert analysis_type.get_attribute("value") == "semantic"
     
     def test_data_explorer(self):
         """Test data explorer functionality"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Find table selector
-        table_select = self.driver.find_element(By.ID, "tableSelect")
-        search_filter = self.driver.find_element(By.ID, "searchFilter")
+        table_select = self.driver.find_element(*TABLE_SELECT)
+        search_filter = self.driver.find_element(*SEARCH_FILTER)
         
         # Test table selection
         table_select.click()
-        knowledge_base_option = self.driver.find_element(By.XPATH, "//option[@value='enterprise_knowledge_base']")
+        knowledge_base_option = self.driver.find_element(*KNOWLEDGE_BASE_OPTION)
         knowledge_base_option.click()
         
         # Test search filter
         search_filter.send_keys("test search")
-        self.assertEqual(search_filter.get_attribute("value"), "test search")
+        assert search_filter.get_attribute("value") == "test search"
     
     def test_visualization_controls(self):
         """Test visualization control buttons"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Find visualization buttons
-        chart_btn = self.driver.find_element(By.XPATH, "//button[contains(@onclick, 'changeVisualization')][@onclick*='chart']")
-        table_btn = self.driver.find_element(By.XPATH, "//button[contains(@onclick, 'changeVisualization')][@onclick*='table']")
+        chart_btn = self.driver.find_element(*VIZ_CHART_BTN)
+        table_btn = self.driver.find_element(*VIZ_TABLE_BTN)
         
-        self.assertTrue(chart_btn.is_displayed())
-        self.assertTrue(table_btn.is_displayed())
+        assert chart_btn.is_displayed()
+        assert table_btn.is_displayed()
         
         # Test button clicks
         table_btn.click()
@@ -470,334 +490,201 @@ class AnalystWorkbenchTests(unittest.TestCase):
         # Verify chart view is shown
 
 
-class MobileInterfaceTests(unittest.TestCase):
+@pytest.mark.ui
+@pytest.mark.usefixtures("ui_page")
+class MobileInterfaceTests:
     """Test mobile interface functionality"""
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up mobile Chrome driver"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=375,667")  # Mobile size
-        chrome_options.add_experimental_option("mobileEmulation", {
-            "deviceName": "iPhone 8"
-        })
-        
-        try:
-            cls.driver = webdriver.Chrome(options=chrome_options)
-            cls.driver.implicitly_wait(10)
-        except Exception as e:
-            pytest.skip(f"Chrome driver not available: {e}")
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up driver"""
-        if hasattr(cls, 'driver'):
-            cls.driver.quit()
-    
-    def setUp(self):
-        """Navigate to mobile interface before each test"""
-        if hasattr(self, 'driver'):
-            self.driver.get("file:///user-interface/mobile/index.html")
+    page_url = "file:///user-interface/mobile/index.html"
+    mobile = True
     
     def test_mobile_interface_loads(self):
         """Test that mobile interface loads successfully"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Check page title
-        self.assertIn("Mobile", self.driver.title)
+        assert "Mobile" in self.driver.title
         
         # Check mobile-specific elements
-        navbar = self.driver.find_element(By.CLASS_NAME, "navbar")
-        bottom_nav = self.driver.find_element(By.CLASS_NAME, "fixed-bottom")
-        
-        self.assertTrue(navbar.is_displayed())
-        self.assertTrue(bottom_nav.is_displayed())
+        visible, _ = probe(self.driver, [".navbar", ".fixed-bottom"])
+        assert all(visible)
     
     def test_mobile_navigation(self):
         """Test mobile bottom navigation"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Test bottom navigation links
-        dashboard_link = self.driver.find_element(By.XPATH, "//a[@href='#dashboard']")
-        insights_link = self.driver.find_element(By.XPATH, "//a[@href='#insights']")
-        search_link = self.driver.find_element(By.XPATH, "//a[@href='#search']")
-        alerts_link = self.driver.find_element(By.XPATH, "//a[@href='#alerts']")
+        visible, _ = probe(self.driver, [css(NAV_DASHBOARD), css(NAV_INSIGHTS), css(NAV_SEARCH), css(NAV_ALERTS)])
+        assert all(visible)
         
         # Test navigation clicks
-        insights_link.click()
-        time.sleep(1)
+        self.driver.find_element(*NAV_INSIGHTS).click()
         
-        # Check that insights section is active
-        insights_section = self.driver.find_element(By.ID, "insights")
-        self.assertIn("active", insights_section.get_attribute("class"))
+        # Check that insights section is active; re-located on each poll so a
+        # re-rendered section can't leave the wait holding a stale element
+        WebDriverWait(self.driver, 2).until(
+            lambda d: "active" in d.find_element(*INSIGHTS_SECTION).get_attribute("class")
+        )
     
     def test_mobile_metric_cards(self):
         """Test mobile metric cards"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Check metric cards are present
-        metric_cards = self.driver.find_elements(By.CLASS_NAME, "metric-card")
-        self.assertEqual(len(metric_cards), 4)
+        WebDriverWait(self.driver, 2).until(
+            lambda d: len(d.find_elements(*METRIC_CARDS)) == 4
+        )
+        metric_cards = self.driver.find_elements(*METRIC_CARDS)
         
         # Check cards are properly sized for mobile
         for card in metric_cards:
-            self.assertTrue(card.is_displayed())
+            assert card.is_displayed()
     
     def test_mobile_sidebar_menu(self):
         """Test mobile sidebar menu"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Click hamburger menu
-        menu_toggle = self.driver.find_element(By.CLASS_NAME, "navbar-toggler")
+        menu_toggle = self.driver.find_element(*NAVBAR_TOGGLER)
         menu_toggle.click()
         
         # Wait for offcanvas menu to appear
         wait = WebDriverWait(self.driver, 10)
-        offcanvas = wait.until(EC.visibility_of_element_located((By.ID, "mobileMenu")))
+        offcanvas = wait.until(EC.visibility_of_element_located(MOBILE_MENU))
         
         # Check menu items
-        menu_items = self.driver.find_elements(By.CSS_SELECTOR, "#mobileMenu .list-group-item")
-        self.assertTrue(len(menu_items) > 0)
+        menu_items = self.driver.find_elements(*MOBILE_MENU_ITEMS)
+        assert len(menu_items) > 0
     
     def test_mobile_search_functionality(self):
         """Test mobile search functionality"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Navigate to search section
-        search_link = self.driver.find_element(By.XPATH, "//a[@href='#search']")
+        search_link = self.driver.find_element(*NAV_SEARCH)
         search_link.click()
         
         # Find search elements
-        search_input = self.driver.find_element(By.ID, "mobileSearchInput")
-        search_type = self.driver.find_element(By.ID, "mobileSearchType")
-        search_button = self.driver.find_element(By.XPATH, "//button[contains(@onclick, 'executeMobileSearch')]")
+        search_input = self.driver.find_element(*MOBILE_SEARCH_INPUT)
+        search_type = self.driver.find_element(*MOBILE_SEARCH_TYPE)
+        search_button = self.driver.find_element(*MOBILE_SEARCH_BTN)
         
         # Test search interaction
         search_input.send_keys("mobile test query")
-        self.assertEqual(search_input.get_attribute("value"), "mobile test query")
+        assert search_input.get_attribute("value") == "mobile test query"
         
-        self.assertTrue(search_button.is_displayed())
+        assert search_button.is_displayed()
     
     def test_mobile_modals(self):
         """Test mobile modal functionality"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         # Navigate to insights section
-        insights_link = self.driver.find_element(By.XPATH, "//a[@href='#insights']")
+        insights_link = self.driver.find_element(*NAV_INSIGHTS)
         insights_link.click()
         
         # Click generate insight button
-        generate_btn = self.driver.find_element(By.XPATH, "//button[contains(@onclick, 'generateMobileInsight')]")
+        generate_btn = self.driver.find_element(*GENERATE_INSIGHT_BTN)
         generate_btn.click()
         
         # Wait for modal to appear
         wait = WebDriverWait(self.driver, 10)
-        modal = wait.until(EC.visibility_of_element_located((By.ID, "mobileInsightModal")))
+        modal = wait.until(EC.visibility_of_element_located(MOBILE_INSIGHT_MODAL))
         
         # Check modal is properly sized for mobile
-        self.assertTrue(modal.is_displayed())
+        assert modal.is_displayed()
         
         # Check modal form elements
-        query_input = self.driver.find_element(By.ID, "mobileInsightQuery")
-        self.assertTrue(query_input.is_displayed())
+        query_input = self.driver.find_element(*MOBILE_INSIGHT_QUERY)
+        assert query_input.is_displayed()
     
     def test_touch_interactions(self):
         """Test touch-friendly interactions"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
-        # Check that buttons are appropriately sized for touch
-        buttons = self.driver.find_elements(By.CLASS_NAME, "btn")
-        
-        for button in buttons[:3]:  # Test first 3 buttons
-            if button.is_displayed():
-                size = button.size
+        # Check that buttons are appropriately sized for touch; heights of the
+        # first 3 buttons come back in one call, hidden ones measure 0
+        heights = self.driver.execute_script(
+            "return [...document.getElementsByClassName('btn')].slice(0, 3)"
+            ".map(button => button.getBoundingClientRect().height);"
+        )
+        
+        for height in heights:
+            if height > 0:
                 # Buttons should be at least 44px high for good touch targets
-                self.assertGreaterEqual(size['height'], 30)
+                assert height >= 30
 
 
-class PerformanceTests(unittest.TestCase):
+@pytest.mark.performance
+class PerformanceTests:
     """Test performance characteristics of the UI"""
     
-    def test_api_response_times(self):
-        """Test API response times are acceptable"""
-        base_url = "http://localhost:8000"
-        
-        # Test health check response time
-        start_time = time.time()
-        with patch('requests.get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"message": "test", "status": "active"}
-            mock_get.return_value = mock_response
-            
-            response = requests.get(f"{base_url}/")
-            
-        end_time = time.time()
-        response_time = end_time - start_time
+    def test_health_latency(self, benchmark, api_client):
+        """Test API health check latency stays low across many rounds"""
+        # A disabled benchmark (e.g. under xdist) measures nothing, so it must not pass
+        if benchmark.disabled:
+            pytest.skip("pytest-benchmark is disabled; run the performance marker without -n")
+        
+        response = benchmark(api_client.get, "/")
         
-        # Response should be under 1 second
-        self.assertLess(response_time, 1.0)
+        assert response.status_code == 200
+        # Median should be under 50ms
+        assert benchmark.stats.stats.median < 0.05
     
-    def test_dashboard_load_time(self):
+    def test_dashboard_load_time(self, desktop_driver):
         """Test dashboard load time performance"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        try:
-            driver = webdriver.Chrome(options=chrome_options)
-            
-            start_time = time.time()
-            driver.get("file:///user-interface/dashboard/index.html")
-            
-            # Wait for page to be fully loaded
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "metric-card"))
+        # Measure a cold first load; every other test keeps the profile's warm cache
+        desktop_driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        desktop_driver.get("file:///user-interface/dashboard/index.html")
+        
+        # Wait for page to be fully loaded
+        WebDriverWait(desktop_driver, 10).until(
+            EC.presence_of_element_located(METRIC_CARDS)
+        )
+        
+        # Read the browser's own navigation timing so WebDriver round trips are not counted;
+        # loadEventEnd stays 0 until the load event has finished
+        load_event_end = WebDriverWait(desktop_driver, 10).until(
+            lambda driver: driver.execute_script(
+                "return performance.getEntriesByType('navigation')[0].loadEventEnd;"
             )
-            
-            end_time = time.time()
-            load_time = end_time - start_time
-            
-            # Page should load within 5 seconds
-            self.assertLess(load_time, 5.0)
-            
-            driver.quit()
-            
-        except Exception as e:
-            self.skipTest(f"Chrome driver not available: {e}")
+        )
+        load_time = load_event_end / 1000
+        
+        # Page should load within 5 seconds
+        assert load_time < 5.0
 
 
-class AccessibilityTests(unittest.TestCase):
+@pytest.mark.accessibility
+@pytest.mark.usefixtures("ui_page")
+class AccessibilityTests:
     """Test accessibility features of the UI"""
     
-    @classmethod
-    def setUpClass(cls):
-        """Set up Chrome driver with accessibility testing"""
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        
-        try:
-            cls.driver = webdriver.Chrome(options=chrome_options)
-            cls.driver.implicitly_wait(10)
-        except Exception as e:
-            pytest.skip(f"Chrome driver not available: {e}")
-    
-    @classmethod
-    def tearDownClass(cls):
-        """Clean up driver"""
-        if hasattr(cls, 'driver'):
-            cls.driver.quit()
-    
     def test_keyboard_navigation(self):
         """Test keyboard navigation functionality"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         self.driver.get("file:///user-interface/dashboard/index.html")
         
-        # Test that interactive elements are focusable
-        buttons = self.driver.find_elements(By.TAG_NAME, "button")
-        links = self.driver.find_elements(By.TAG_NAME, "a")
-        inputs = self.driver.find_elements(By.TAG_NAME, "input")
-        
-        focusable_elements = buttons + links + inputs
+        # Test that the first 5 interactive elements can receive focus, in one round trip
+        focused = self.driver.execute_script(
+            FOCUS_SCRIPT, [css(BUTTONS), css(LINKS), css(INPUTS)], 5
+        )
         
-        for element in focusable_elements[:5]:  # Test first 5 elements
-            if element.is_displayed():
-                # Check that element can receive focus
-                self.driver.execute_script("arguments[0].focus();", element)
-                focused_element = self.driver.switch_to.active_element
-                self.assertEqual(element, focused_element)
+        assert all(focused)
     
     def test_aria_labels(self):
         """Test ARIA labels and accessibility attributes"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         self.driver.get("file:///user-interface/dashboard/index.html")
         
-        # Check for proper ARIA labels on interactive elements
-        buttons = self.driver.find_elements(By.TAG_NAME, "button")
+        # Check for proper ARIA labels on the first 3 buttons
+        buttons = self.driver.execute_script(LABELS_SCRIPT, css(BUTTONS), 3)
         
-        for button in buttons[:3]:  # Test first 3 buttons
-            if button.is_displayed():
-                # Button should have either text content or aria-label
-                text_content = button.text.strip()
-                aria_label = button.get_attribute("aria-label")
-                
-                self.assertTrue(
-                    len(text_content) > 0 or aria_label is not None,
-                    "Button should have text content or aria-label"
-                )
+        for button in buttons:
+            # Button should have either text content or aria-label
+            assert len(button["text"]) > 0 or button["aria_label"] is not None, \
+                "Button should have text content or aria-label"
     
     def test_color_contrast(self):
         """Test color contrast ratios"""
-        if not hasattr(self, 'driver'):
-            self.skipTest("Chrome driver not available")
-            
         self.driver.get("file:///user-interface/dashboard/index.html")
         
         # This is a simplified test - in practice, you'd use tools like axe-core
-        # Check that text elements have sufficient contrast
-        text_elements = self.driver.find_elements(By.TAG_NAME, "p")
-        text_elements.extend(self.driver.find_elements(By.TAG_NAME, "h1"))
-        text_elements.extend(self.driver.find_elements(By.TAG_NAME, "h2"))
-        text_elements.extend(self.driver.find_elements(By.TAG_NAME, "h3"))
-        
-        for element in text_elements[:5]:  # Test first 5 elements
-            if element.is_displayed() and element.text.strip():
-                # Check that element has color styling
-                color = element.value_of_css_property("color")
-                background_color = element.value_of_css_property("background-color")
-                
+        # Check that text elements have sufficient contrast; the first 5 p/h1/h2/h3
+        # elements and their computed colors come back in one round trip
+        text_elements = self.driver.execute_script(TEXT_STYLES_SCRIPT, 5)
+        
+        for element in text_elements:
+            if element["visible"] and element["text"]:
                 # Basic check that colors are defined
-                self.assertIsNotNone(color)
-                self.assertIsNotNone(background_color)
+                assert element["color"] is not None
+                assert element["background_color"] is not None
 
 
 if __name__ == '__main__':
-    # Run all test suites
-    test_suites = [
-        unittest.TestLoader().loadTestsFromTestCase(APIIntegrationTests),
-        unittest.TestLoader().loadTestsFromTestCase(DashboardUITests),
-        unittest.TestLoader().loadTestsFromTestCase(AnalystWorkbenchTests),
-        unittest.TestLoader().loadTestsFromTestCase(MobileInterfaceTests),
-        unittest.TestLoader().loadTestsFromTestCase(PerformanceTests),
-        unittest.TestLoader().loadTestsFromTestCase(AccessibilityTests)
-    ]
-    
-    combined_suite = unittest.TestSuite(test_suites)
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(combined_suite)
-    
-    # Print summary
-    print(f"\n{'='*50}")
-    print(f"INTEGRATION TEST SUMMARY")
-    print(f"{'='*50}")
-    print(f"Tests run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Success rate: {((result.testsRun - len(result.failures) - len(result.errors)) / result.testsRun * 100):.1f}%")
-    
-    if result.failures:
-        print(f"\nFAILURES:")
-        for test, traceback in result.failures:
-            print(f"- {test}: {traceback.split('AssertionError: ')[-1].split('\\n')[0]}")
-    
-    if result.errors:
-        print(f"\nERRORS:")
-        for test, traceback in result.errors:
-            print(f"- {test}: {traceback.split('\\n')[-2]}")
\ No newline at end of file
+    # Run all test classes; pytest prints its own summary
+    sys.exit(pytest.main([__file__, "-v"]))
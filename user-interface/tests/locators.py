@@ -0,0 +1,64 @@
+"""
+Element locators for the UI integration tests
+Built once at import and unpacked into find_element/find_elements calls
+"""
+
+from selenium.webdriver.common.by import By
+
+# Shared across pages
+NAVBAR = (By.CLASS_NAME, "navbar")
+METRIC_CARDS = (By.CLASS_NAME, "metric-card")
+GENERATE_INSIGHT_BTN = (By.CSS_SELECTOR, '[data-testid="generate-insight-btn"]')
+BUTTONS = (By.TAG_NAME, "button")
+LINKS = (By.TAG_NAME, "a")
+INPUTS = (By.TAG_NAME, "input")
+
+# Executive dashboard
+INSIGHT_MODAL = (By.ID, "insightModal")
+INSIGHT_QUERY = (By.ID, "insightQuery")
+CONTEXT_SELECT = (By.ID, "contextSelect")
+CREATE_FORECAST_BTN = (By.CSS_SELECTOR, '[data-testid="create-forecast-btn"]')
+FORECAST_MODAL = (By.ID, "forecastModal")
+METRIC_SELECT = (By.ID, "metricSelect")
+HORIZON_INPUT = (By.ID, "horizonInput")
+CONFIDENCE_INPUT = (By.ID, "confidenceInput")
+DROPDOWN_TOGGLE = (By.CLASS_NAME, "dropdown-toggle")
+DROPDOWN_MENU = (By.CLASS_NAME, "dropdown-menu")
+ANALYST_WORKBENCH_LINK = (By.CSS_SELECTOR, '[data-testid="analyst-workbench-link"]')
+
+# Analyst workbench
+SIDEBAR = (By.CLASS_NAME, "sidebar")
+MAIN_CONTENT = (By.CLASS_NAME, "main-content")
+QUERY_INPUT = (By.ID, "queryInput")
+ANALYSIS_TYPE = (By.ID, "analysisType")
+TIME_RANGE = (By.ID, "timeRange")
+PREDICTIVE_OPTION = (By.CSS_SELECTOR, 'option[value="predictive"]')
+DATA_SOURCE_LINKS = (By.CSS_SELECTOR, '[data-testid^="source-"]')
+ANALYSIS_TOOL_LINKS = (By.CSS_SELECTOR, '[data-testid^="tool-"]')
+SEMANTIC_SEARCH_LINK = (By.CSS_SELECTOR, '[data-testid="tool-semantic-search"]')
+TABLE_SELECT = (By.ID, "tableSelect")
+SEARCH_FILTER = (By.ID, "searchFilter")
+KNOWLEDGE_BASE_OPTION = (By.CSS_SELECTOR, 'option[value="enterprise_knowledge_base"]')
+VIZ_CHART_BTN = (By.CSS_SELECTOR, '[data-testid="viz-chart-btn"]')
+VIZ_TABLE_BTN = (By.CSS_SELECTOR, '[data-testid="viz-table-btn"]')
+
+# Mobile interface
+NAV_DASHBOARD = (By.CSS_SELECTOR, '[data-testid="nav-dashboard"]')
+NAV_INSIGHTS = (By.CSS_SELECTOR, '[data-testid="nav-insights"]')
+NAV_SEARCH = (By.CSS_SELECTOR, '[data-testid="nav-search"]')
+NAV_ALERTS = (By.CSS_SELECTOR, '[data-testid="nav-alerts"]')
+INSIGHTS_SECTION = (By.ID, "insights")
+NAVBAR_TOGGLER = (By.CLASS_NAME, "navbar-toggler")
+MOBILE_MENU = (By.ID, "mobileMenu")
+MOBILE_MENU_ITEMS = (By.CSS_SELECTOR, "#mobileMenu .list-group-item")
+MOBILE_SEARCH_INPUT = (By.ID, "mobileSearchInput")
+MOBILE_SEARCH_TYPE = (By.ID, "mobileSearchType")
+MOBILE_SEARCH_BTN = (By.CSS_SELECTOR, '[data-testid="search-btn"]')
+MOBILE_INSIGHT_MODAL = (By.ID, "mobileInsightModal")
+MOBILE_INSIGHT_QUERY = (By.ID, "mobileInsightQuery")
+
+
+def css(locator):
+    """CSS selector equivalent of a locator, for lookups batched into page scripts"""
+    by, value = locator
+    return {By.ID: f"#{value}", By.CLASS_NAME: f".{value}", By.TAG_NAME: value}.get(by, value)
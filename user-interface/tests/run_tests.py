@@ -6,65 +6,99 @@ Runs comprehensive tests for API endpoints, dashboard, analyst workbench, and mo
 
 import os
 import sys
+import shlex
+import shutil
+import hashlib
 import subprocess
 import argparse
 import json
+import orjson
+import time
+import urllib.request
+import xml.etree.ElementTree as ET
+from collections import deque
 from datetime import datetime
 
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+# The test requirements pull in the API's with -r, so both feed the install check
+REQUIREMENTS_FILES = [
+    os.path.join(TESTS_DIR, "requirements.txt"),
+    os.path.join(TESTS_DIR, "..", "api", "requirements.txt")
+]
+REQUIREMENTS_STAMP = os.path.join(TESTS_DIR, ".requirements.sha256")
+GRID_URL = "http://localhost:4444"
+# pytest prints its failure summary last, so the tail of a failed run's output is what the report keeps
+REPORT_OUTPUT_LIMIT = 16384
+OUTPUT_TAIL_LINES = 2000
+
 def run_command(command, description):
-    """Run a command and return the result"""
+    """Run a command (an argument list, no shell) and return the result"""
     print(f"\n{'='*60}")
     print(f"Running: {description}")
-    print(f"Command: {command}")
+    print(f"Command: {shlex.join(command)}")
     print(f"{'='*60}")
     
     try:
-        result = subprocess.run(
+        # Stream output as it arrives and keep only a bounded tail for the report
+        process = subprocess.Popen(
             command,
-            shell=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300  # 5 minute timeout
+            bufsize=1,
+            env={**os.environ, "PYTHONUNBUFFERED": "1"}
         )
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        with process:
+            for line in process.stdout:
+                print(line, end='')
+                tail.append(line)
         
-        if result.stdout:
-            print("STDOUT:")
-            print(result.stdout)
-        
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
-        
-        return result.returncode == 0, result.stdout, result.stderr
+        # stderr is merged into stdout so lines keep their original order
+        return process.returncode == 0, "".join(tail), ""
     
-    except subprocess.TimeoutExpired:
-        print("ERROR: Command timed out after 5 minutes")
-        return False, "", "Command timed out"
     except Exception as e:
         print(f"ERROR: Failed to run command: {e}")
         return False, "", str(e)
 
+def requirements_hash():
+    """Hash the requirement files together with the interpreter they install into"""
+    digest = hashlib.sha256(sys.executable.encode())
+    for path in REQUIREMENTS_FILES:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
 def setup_test_environment():
     """Set up the test environment"""
     print("Setting up test environment...")
     
-    # Install test dependencies
-    success, stdout, stderr = run_command(
-        "pip install -r user-interface/tests/requirements.txt",
-        "Installing test dependencies"
-    )
+    # Install test dependencies, unless this interpreter already has this exact set
+    current_hash = requirements_hash()
+    installed_hash = None
+    if os.path.exists(REQUIREMENTS_STAMP):
+        with open(REQUIREMENTS_STAMP) as f:
+            installed_hash = f.read().strip()
     
-    if not success:
-        print("Failed to install test dependencies")
-        return False
+    if installed_hash == current_hash:
+        print("Test dependencies unchanged since last install, skipping pip")
+    else:
+        success, stdout, stderr = run_command(
+            [sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS_FILES[0]],
+            "Installing test dependencies"
+        )
+        
+        if not success:
+            print("Failed to install test dependencies")
+            return False
+        
+        with open(REQUIREMENTS_STAMP, 'w') as f:
+            f.write(current_hash)
     
     # Check if Chrome/Chromium is available for Selenium tests
-    chrome_available = False
-    for chrome_cmd in ["google-chrome", "chromium-browser", "chrome"]:
-        success, _, _ = run_command(f"which {chrome_cmd}", f"Checking for {chrome_cmd}")
-        if success:
-            chrome_available = True
-            break
+    chrome_available = any(
+        shutil.which(chrome_cmd) for chrome_cmd in ("google-chrome", "chromium-browser", "chrome")
+    )
     
     if not chrome_available:
         print("WARNING: Chrome/Chromium not found. UI tests will be skipped.")
@@ -72,91 +106,109 @@ def setup_test_environment():
     
     return True
 
-def run_api_tests():
-    """Run API integration tests"""
-    print("\n" + "="*60)
-    print("RUNNING API INTEGRATION TESTS")
-    print("="*60)
-    
-    # Start mock API server for testing (in a real scenario)
-    # For this demo, we'll run the tests with mocked responses
-    
-    success, stdout, stderr = run_command(
-        "python -m pytest user-interface/tests/integration_tests.py::APIIntegrationTests -v --tb=short",
-        "API Integration Tests"
+def start_selenium_grid():
+    """Start one local Selenium Grid for every pytest worker to share"""
+    server = shutil.which("selenium-server")
+    if not server:
+        print("WARNING: selenium-server not found. Each worker will launch its own chromedriver.")
+        return None
+    
+    print(f"Starting Selenium Grid at {GRID_URL}")
+    process = subprocess.Popen(
+        [server, "standalone", "--port", "4444"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
     )
     
-    return success, stdout, stderr
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            with urllib.request.urlopen(f"{GRID_URL}/status", timeout=1) as response:
+                if json.load(response)["value"]["ready"]:
+                    # Inherited by the pytest run; conftest attaches to the grid when it is set
+                    os.environ["SELENIUM_REMOTE_URL"] = GRID_URL
+                    return process
+        except (OSError, ValueError, KeyError):
+            pass
+        time.sleep(0.5)
+    
+    print("WARNING: Selenium Grid did not become ready. Each worker will launch its own chromedriver.")
+    process.terminate()
+    return None
 
-def run_ui_tests():
-    """Run UI integration tests"""
-    print("\n" + "="*60)
-    print("RUNNING UI INTEGRATION TESTS")
-    print("="*60)
-    
-    test_classes = [
-        "DashboardUITests",
-        "AnalystWorkbenchTests", 
-        "MobileInterfaceTests"
+def run_pytest(name, marker, parallel):
+    """Run one pytest invocation and return its outcome and JUnit XML file"""
+    junit_file = f"test_results_{name}.xml"
+    command = [
+        sys.executable, "-m", "pytest", "user-interface/tests/integration_tests.py",
+        "-v", "--tb=short", f"--html=test_report_{name}.html", "--self-contained-html",
+        f"--junitxml={junit_file}"
     ]
+    if marker:
+        command += ["-m", marker]
     
-    results = {}
+    # loadscope keeps each class, and so each page's tests, on one worker
+    if parallel:
+        command += ["-n", "auto", "--dist=loadscope"]
     
-    for test_class in test_classes:
-        print(f"\nRunning {test_class}...")
-        success, stdout, stderr = run_command(
-            f"python -m pytest user-interface/tests/integration_tests.py::{test_class} -v --tb=short",
-            f"{test_class} Tests"
-        )
-        results[test_class] = {
-            'success': success,
-            'stdout': stdout,
-            'stderr': stderr
-        }
+    # A leftover report from an earlier run must not stand in for this one
+    if os.path.exists(junit_file):
+        os.remove(junit_file)
     
-    return results
+    success, stdout, stderr = run_command(command, f"{name.capitalize()} Integration Tests")
+    return success, stdout, stderr, junit_file
 
-def run_performance_tests():
-    """Run performance tests"""
+def run_tests(test_type):
+    """Run the selected integration tests, keyed by pytest run"""
     print("\n" + "="*60)
-    print("RUNNING PERFORMANCE TESTS")
+    print(f"RUNNING {test_type.upper()} INTEGRATION TESTS")
     print("="*60)
     
-    success, stdout, stderr = run_command(
-        "python -m pytest user-interface/tests/integration_tests.py::PerformanceTests -v --tb=short",
-        "Performance Tests"
-    )
-    
-    return success, stdout, stderr
+    # The API tests call the app in-process through TestClient with BigQuery
+    # mocked, so no API server needs to be running. Test types are selected by
+    # marker, so one run shares its pytest startup and Chrome drivers.
+    # pytest-benchmark disables itself under xdist, so the performance tests
+    # always get a serial run of their own.
+    runs = []
+    if test_type != 'performance':
+        runs.append((test_type, 'not performance' if test_type == 'all' else test_type, True))
+    if test_type in ('performance', 'all'):
+        runs.append(('performance', 'performance', False))
+    
+    return {name: run_pytest(name, marker, parallel) for name, marker, parallel in runs}
 
-def run_accessibility_tests():
-    """Run accessibility tests"""
-    print("\n" + "="*60)
-    print("RUNNING ACCESSIBILITY TESTS")
-    print("="*60)
-    
-    success, stdout, stderr = run_command(
-        "python -m pytest user-interface/tests/integration_tests.py::AccessibilityTests -v --tb=short",
-        "Accessibility Tests"
-    )
-    
-    return success, stdout, stderr
-
-def run_all_tests():
-    """Run all integration tests"""
-    print("\n" + "="*60)
-    print("RUNNING ALL INTEGRATION TESTS")
-    print("="*60)
-    
-    success, stdout, stderr = run_command(
-        "python -m pytest user-interface/tests/integration_tests.py -v --tb=short --html=test_report.html --self-contained-html",
-        "All Integration Tests"
-    )
+def parse_junit_results(junit_file):
+    """Bucket the JUnit XML test cases into per-suite results by test class"""
+    results = {}
+    if not os.path.exists(junit_file):
+        return results
+    
+    for case in ET.parse(junit_file).getroot().iter('testcase'):
+        # Module-level tests have the module itself as their class name
+        suite = case.get('classname', '').rsplit('.', 1)[-1]
+        result = results.setdefault(suite, {'success': True, 'tests': 0, 'skipped': 0, 'failed': []})
+        result['tests'] += 1
+        
+        if case.find('skipped') is not None:
+            result['skipped'] += 1
+        for outcome in ('failure', 'error'):
+            element = case.find(outcome)
+            if element is not None:
+                result['success'] = False
+                result['failed'].append(f"{case.get('name')}: {element.get('message', outcome)}")
     
-    return success, stdout, stderr
+    return results
 
 def generate_test_report(results):
     """Generate a comprehensive test report"""
+    # Passing suites need no output in the report; failing ones keep the tail
+    for result in results.values():
+        if isinstance(result, dict):
+            for stream in ('stdout', 'stderr'):
+                if stream in result:
+                    output = result[stream] or ""
+                    result[stream] = "" if result.get('success') else output[-REPORT_OUTPUT_LIMIT:]
+    
     report = {
         'timestamp': datetime.now().isoformat(),
         'summary': {
@@ -179,10 +231,17 @@ def generate_test_report(results):
             report['summary']['failed_test_suites'] += 1
             report['summary']['overall_success'] = False
     
-    # Write report to file
-    report_file = f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    # Write report to file as NDJSON: one line per suite, then a summary line
+    report_file = f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+    with open(report_file, 'wb') as f:
+        for test_name, result in results.items():
+            record = result if isinstance(result, dict) else {'success': result}
+            f.write(orjson.dumps({'type': 'suite', 'name': test_name, **record}) + b'\n')
+        f.write(orjson.dumps({
+            'type': 'summary',
+            'timestamp': report['timestamp'],
+            **report['summary']
+        }) + b'\n')
     
     print(f"\n{'='*60}")
     print("TEST EXECUTION SUMMARY")
@@ -202,6 +261,8 @@ def main():
                        default='all', help='Type of tests to run')
     parser.add_argument('--skip-setup', action='store_true', help='Skip test environment setup')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
+    parser.add_argument('--grid', action='store_true',
+                       help='Share one local Selenium Grid across all UI test workers')
     
     args = parser.parse_args()
     
@@ -216,45 +277,22 @@ def main():
             print("Failed to set up test environment")
             sys.exit(1)
     
-    results = {}
+    # The API tests never open a browser, so they have no use for the grid
+    grid = start_selenium_grid() if args.grid and args.test_type != 'api' else None
     
     try:
-        if args.test_type == 'api' or args.test_type == 'all':
-            success, stdout, stderr = run_api_tests()
-            results['api_tests'] = {
-                'success': success,
-                'stdout': stdout,
-                'stderr': stderr
-            }
-        
-        if args.test_type == 'ui' or args.test_type == 'all':
-            ui_results = run_ui_tests()
-            results.update(ui_results)
-        
-        if args.test_type == 'performance' or args.test_type == 'all':
-            success, stdout, stderr = run_performance_tests()
-            results['performance_tests'] = {
-                'success': success,
-                'stdout': stdout,
-                'stderr': stderr
-            }
-        
-        if args.test_type == 'accessibility' or args.test_type == 'all':
-            success, stdout, stderr = run_accessibility_tests()
-            results['accessibility_tests'] = {
-                'success': success,
-                'stdout': stdout,
-                'stderr': stderr
-            }
-        
-        if args.test_type == 'all':
-            # Also run all tests together for comprehensive report
-            success, stdout, stderr = run_all_tests()
-            results['comprehensive_test'] = {
-                'success': success,
-                'stdout': stdout,
-                'stderr': stderr
-            }
+        results = {}
+        for name, (success, stdout, stderr, junit_file) in run_tests(args.test_type).items():
+            suites = parse_junit_results(junit_file)
+            
+            # pytest failed outside any test case (collection error, crashed worker); keep its output
+            if not success and all(result['success'] for result in suites.values()):
+                suites[f'{name}_tests'] = {
+                    'success': success,
+                    'stdout': stdout,
+                    'stderr': stderr
+                }
+            results.update(suites)
     
     except KeyboardInterrupt:
         print("\nTest execution interrupted by user")
@@ -262,6 +300,10 @@ def main():
     except Exception as e:
         print(f"\nUnexpected error during test execution: {e}")
         sys.exit(1)
+    finally:
+        if grid:
+            grid.terminate()
+            grid.wait()
     
     # Generate and display report
     report = generate_test_report(results)